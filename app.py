@@ -5,14 +5,48 @@ A clean, modern web interface for NBA Elo ratings calculations
 """
 
 from flask import Flask, render_template, jsonify, request
-import json
+from flask.json.provider import DefaultJSONProvider
+import orjson
+import numpy as np
 import math
 import os
-from datetime import datetime
-from collections import defaultdict
+import sys
+from datetime import datetime, timedelta, timezone
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    if sys.version_info >= (3, 11):
+        # fromisoformat accepts the trailing 'Z' itself from 3.11 on
+        parse_datetime = datetime.fromisoformat
+    else:
+        def parse_datetime(value):
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+from elo_kernel import (fold_elo, game_weights, series_win_probability, warmup as warmup_elo_kernel,
+                        ELO_SCALE, INV_LOG20, MOV_TABLE, HIGHER_SEED_HOME)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization;
+    NumPy arrays and scalars are serialized natively"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Initialize Flask app with production-ready configuration
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Security configuration using environment variables
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
@@ -21,6 +55,18 @@ app.config['DEBUG'] = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
 # Optional: Database configuration (if you add a database later)
 # app.config['DATABASE_URL'] = os.environ.get('DATABASE_URL')
 
+# Season data file served by the API
+GAMES_FILE = 'nba_2024_games.json'
+
+# Season files larger than this are stream-parsed (with ijson) to bound peak memory
+STREAM_PARSE_BYTES = 32 * 1024 * 1024
+
+# Margin-of-victory multipliers as a tuple for the scalar update path
+MOV_LUT = tuple(MOV_TABLE.tolist())
+
+# Compile the Elo kernel at import so the first request doesn't pay for it
+warmup_elo_kernel()
+
 # CORS and security headers for production
 @app.after_request
 def after_request(response):
@@ -35,17 +81,60 @@ def after_request(response):
     response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
     response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
     
+    # GET API responses can change whenever the season data does: clients and
+    # proxies may store them but must revalidate every time, which the ETag
+    # answers with a bodyless 304 while the data is unchanged
+    if request.method == 'GET' and request.path.startswith('/api/') and response.status_code == 200:
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        response.add_etag()
+        response.make_conditional(request)
+    
     return response
 
 class EloCalculator:
-    def __init__(self, initial_elo=1000, k_factor_type='fixed', k_factor_value=20):
+    def __init__(self, initial_elo=1000, k_factor_type='fixed', k_factor_value=20, track_history=False,
+                 team_names=()):
         self.initial_elo = initial_elo
         self.k_factor_type = k_factor_type
         self.k_factor_value = k_factor_value
-        self.team_elos = defaultdict(lambda: initial_elo)
-        self.team_records = defaultdict(lambda: {'wins': 0, 'losses': 0})
+        # Ratings and [wins, losses] as arrays indexed by team id; teams not in
+        # team_names get an id the first time update_elo sees them
+        self.team_names = list(team_names)
+        self.team_to_idx = {team: i for i, team in enumerate(self.team_names)}
+        self.elos = np.full(len(self.team_names), initial_elo, dtype=np.float64)
+        self.records = np.zeros((len(self.team_names), 2), dtype=np.int64)
         self.game_count = 0
-        self.elo_history = defaultdict(list)
+        # Per-team history as preallocated columns (game number, elo) with a fill
+        # cursor; only filled when track_history is set
+        self.track_history = track_history
+        self.hist_games = {}
+        self.hist_elos = {}
+        self.hist_len = defaultdict(int)
+    
+    def _team_id(self, team):
+        """Id of a team, growing the arrays for a team not seen before"""
+        idx = self.team_to_idx.get(team)
+        if idx is None:
+            idx = len(self.team_names)
+            self.team_names.append(team)
+            self.team_to_idx[team] = idx
+            self.elos = np.append(self.elos, float(self.initial_elo))
+            self.records = np.vstack([self.records, np.zeros((1, 2), dtype=np.int64)])
+        return idx
+    
+    @property
+    def team_elos(self):
+        """Current rating per team that has played, as a dict"""
+        played = self.records.sum(axis=1) > 0
+        return {team: elo for team, elo, p in zip(self.team_names, self.elos.tolist(), played) if p}
+    
+    @property
+    def team_records(self):
+        """{'wins', 'losses'} per team that has played, as a dict"""
+        return {team: {'wins': wins, 'losses': losses}
+                for team, (wins, losses) in zip(self.team_names, self.records.tolist())
+                if wins or losses}
     
     def get_k_factor(self, game_number, total_games):
         """Get K-factor based on type and game progression"""
@@ -57,24 +146,33 @@ class EloCalculator:
             return 40 - (30 * progress)
         return 20
     
+    def get_k_factors(self, total_games):
+        """Get K-factors for games 1..total_games as an array"""
+        if self.k_factor_type == 'fixed':
+            return np.full(total_games, self.k_factor_value, dtype=np.float64)
+        elif self.k_factor_type == 'decreasing':
+            progress = np.arange(1, total_games + 1, dtype=np.float64) / total_games
+            return 40 - (30 * progress)
+        return np.full(total_games, 20, dtype=np.float64)
+    
     def expected_score(self, rating_a, rating_b):
         """Calculate expected score for team A against team B"""
-        return 1 / (1 + 10**((rating_b - rating_a) / 400))
+        return 1.0 / (1.0 + math.exp((rating_b - rating_a) * ELO_SCALE))
     
     def update_elo(self, team_a, team_b, score_a, score_b, game_number, total_games):
         """Update Elo ratings based on game result"""
-        rating_a = self.team_elos[team_a]
-        rating_b = self.team_elos[team_b]
+        a = self._team_id(team_a)
+        b = self._team_id(team_b)
+        elos = self.elos
+        rating_a = float(elos[a])
+        rating_b = float(elos[b])
         
         # Determine actual score (1 for win, 0 for loss) and update records
-        if score_a > score_b:
-            actual_a, actual_b = 1, 0
-            self.team_records[team_a]['wins'] += 1
-            self.team_records[team_b]['losses'] += 1
-        else:
-            actual_a, actual_b = 0, 1
-            self.team_records[team_b]['wins'] += 1
-            self.team_records[team_a]['losses'] += 1
+        actual_a = 1 if score_a > score_b else 0
+        actual_b = 1 - actual_a
+        records = self.records
+        records[a, 1 - actual_a] += 1
+        records[b, 1 - actual_b] += 1
             
         # Calculate expected scores
         expected_a = self.expected_score(rating_a, rating_b)
@@ -82,7 +180,10 @@ class EloCalculator:
         
         # Apply margin of victory multiplier
         score_diff = abs(score_a - score_b)
-        mov_multiplier = math.log(score_diff + 1) / math.log(20)
+        if score_diff < len(MOV_LUT):
+            mov_multiplier = MOV_LUT[score_diff]
+        else:
+            mov_multiplier = math.log(score_diff + 1) * INV_LOG20
         
         # Get K-factor for this game
         k_factor = self.get_k_factor(game_number, total_games)
@@ -91,76 +192,301 @@ class EloCalculator:
         new_rating_a = rating_a + k_factor * mov_multiplier * (actual_a - expected_a)
         new_rating_b = rating_b + k_factor * mov_multiplier * (actual_b - expected_b)
         
-        self.team_elos[team_a] = new_rating_a
-        self.team_elos[team_b] = new_rating_b
+        elos[a] = new_rating_a
+        elos[b] = new_rating_b
+        self.game_count += 1
         
         # Store history
-        self.elo_history[team_a].append({'game': game_number, 'elo': new_rating_a, 'date': datetime.now().isoformat()})
-        self.elo_history[team_b].append({'game': game_number, 'elo': new_rating_b, 'date': datetime.now().isoformat()})
+        if self.track_history:
+            self._record_history(team_a, [game_number], [new_rating_a], total_games)
+            self._record_history(team_b, [game_number], [new_rating_b], total_games)
         
         return new_rating_a, new_rating_b
-
-def load_games_data():
-    """Load NBA games data"""
-    try:
-        with open('nba_2024_games.json', 'r') as f:
-            data = json.load(f)
+    
+    def _record_history(self, team, game_numbers, elos, total_games):
+        """Append history entries to the team's preallocated columns"""
+        i = self.hist_len[team]
+        end = i + len(game_numbers)
+        if team not in self.hist_games:
+            size = max(total_games, end, 1)
+            self.hist_games[team] = np.empty(size, dtype=np.int32)
+            self.hist_elos[team] = np.empty(size, dtype=np.float32)
+        elif end > len(self.hist_games[team]):
+            # More games than announced: grow by doubling
+            size = max(2 * len(self.hist_games[team]), end)
+            games = np.empty(size, dtype=np.int32)
+            games[:i] = self.hist_games[team][:i]
+            elos_col = np.empty(size, dtype=np.float32)
+            elos_col[:i] = self.hist_elos[team][:i]
+            self.hist_games[team] = games
+            self.hist_elos[team] = elos_col
+        self.hist_games[team][i:end] = game_numbers
+        self.hist_elos[team][i:end] = elos
+        self.hist_len[team] = end
+    
+    def get_elo_history(self, team):
+        """Get (game numbers, elos) arrays for a team's tracked history"""
+        n = self.hist_len.get(team, 0)
+        if n == 0:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        return self.hist_games[team][:n], self.hist_elos[team][:n]
+    
+    def run_batch(self, home_idx, away_idx, home_score, away_score, k_array):
+        """
+        Process a whole run of games given as parallel arrays.
+        home_idx/away_idx are team ids (positions in team_names); k_array holds
+        the K-factor per game. Ratings, win/loss records and (with track_history)
+        per-game ratings are produced by the compiled kernel in elo_kernel.fold_elo;
+        games are numbered on from game_count.
+        Raises ValueError for a team id outside team_names, since the kernel
+        does no bounds checking.
+        """
+        home_idx = np.ascontiguousarray(home_idx, dtype=np.intp)
+        away_idx = np.ascontiguousarray(away_idx, dtype=np.intp)
+        if home_idx.size and (min(home_idx.min(), away_idx.min()) < 0 or
+                              max(home_idx.max(), away_idx.max()) >= len(self.elos)):
+            raise ValueError(f"Team ids must be in range(0, {len(self.elos)})")
+        home_score = np.ascontiguousarray(home_score, dtype=np.int64)
+        away_score = np.ascontiguousarray(away_score, dtype=np.int64)
+        k_array = np.ascontiguousarray(k_array, dtype=np.float64)
+        
+        # Everything that doesn't depend on the running ratings is done as whole vectors
+        home_won, weight = game_weights(home_score, away_score, k_array)
+        
+        n_games = len(k_array)
+        history = np.empty((n_games if self.track_history else 0, 2), dtype=np.float64)
+        fold_elo(home_idx, away_idx, home_won, weight, self.elos, self.records, history)
         
-        all_games = []
-        for game in data['response']:
-            # Only process finished games with valid scores, exclude preseason
-            if (game['status']['short'] == 3 and 
-                game['scores']['home']['points'] is not None and 
-                game['scores']['visitors']['points'] is not None and
-                game['stage'] != 1):  # Stage 1 = Preseason, 2 = Regular Season, 3+ = Playoffs
-                
-                game_date = datetime.fromisoformat(game['date']['start'].replace('Z', '+00:00'))
-                
-                all_games.append({
-                    'id': game['id'],
-                    'date': game_date,
-                    'stage': game['stage'],
-                    'home_team': game['teams']['home']['name'],
-                    'visitor_team': game['teams']['visitors']['name'],
-                    'home_score': int(game['scores']['home']['points']),
-                    'visitor_score': int(game['scores']['visitors']['points'])
-                })
+        if self.track_history:
+            # Split the per-game (home, away) ratings into each team's history
+            game_numbers = np.arange(self.game_count + 1, self.game_count + n_games + 1)
+            for team_id in np.union1d(home_idx, away_idx).tolist():
+                at_home = home_idx == team_id
+                played = np.flatnonzero(at_home | (away_idx == team_id))
+                elos = np.where(at_home[played], history[played, 0], history[played, 1])
+                self._record_history(self.team_names[team_id], game_numbers[played], elos,
+                                     self.game_count + n_games)
+        self.game_count += n_games
         
-        all_games.sort(key=lambda x: x['date'])
-        return all_games
+        return self.elos
+
+def _iter_raw_games(filename):
+    """
+    Yield raw game objects from a season file's 'response' array.
+    Large files are streamed item by item so the whole document is never
+    materialized; normal-sized files are parsed in one go with orjson.
+    """
+    if ijson is not None and os.path.getsize(filename) > STREAM_PARSE_BYTES:
+        with open(filename, 'rb') as f:
+            yield from ijson.items(f, 'response.item', use_float=True)
+        return
+    
+    with open(filename, 'rb') as f:
+        data = orjson.loads(f.read())
+    yield from data['response']
+
+def _is_counted_game(game):
+    """Only finished games with valid scores count, excluding preseason"""
+    return (game['status']['short'] == 3 and 
+            game['scores']['home']['points'] is not None and 
+            game['scores']['visitors']['points'] is not None and
+            game['stage'] != 1)  # Stage 1 = Preseason, 2 = Regular Season, 3+ = Playoffs
+
+# Season games as parallel read-only arrays, one entry per game in date order.
+# home_idx/away_idx index team_names; date is UTC datetime64[ms].
+GamesTable = namedtuple('GamesTable', 'team_names team_to_idx ids home_idx away_idx '
+                                      'home_score away_score date stage')
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+@lru_cache(maxsize=8)
+def _games_table_cached(filename, mtime):
+    """
+    Build the GamesTable for a season file straight from the raw games, without
+    the per-game dicts: counted games are collected first, then typed arrays of
+    that size are filled in one pass and put in date order with a stable argsort.
+    """
+    games = [game for game in _iter_raw_games(filename) if _is_counted_game(game)]
+    
+    n = len(games)
+    ids = np.empty(n, dtype=np.int64)
+    home_idx = np.empty(n, dtype=np.intp)
+    away_idx = np.empty(n, dtype=np.intp)
+    home_score = np.empty(n, dtype=np.int64)
+    away_score = np.empty(n, dtype=np.int64)
+    date_ms = np.empty(n, dtype=np.int64)
+    stage = np.empty(n, dtype=np.int8)
+    seen = {}  # team -> id in order of first appearance
+    for i, game in enumerate(games):
+        ids[i] = game['id']
+        home_idx[i] = seen.setdefault(game['teams']['home']['name'], len(seen))
+        away_idx[i] = seen.setdefault(game['teams']['visitors']['name'], len(seen))
+        home_score[i] = int(game['scores']['home']['points'])
+        away_score[i] = int(game['scores']['visitors']['points'])
+        date_ms[i] = (parse_datetime(game['date']['start']) - _EPOCH) // _ONE_MS
+        stage[i] = game['stage']
+    
+    # Renumber teams alphabetically
+    team_names = tuple(sorted(seen))
+    team_to_idx = {team: i for i, team in enumerate(team_names)}
+    renumber = np.array([team_to_idx[team] for team in seen], dtype=np.intp)
+    
+    order = np.argsort(date_ms, kind='stable')
+    columns = [ids[order], renumber[home_idx[order]], renumber[away_idx[order]],
+               home_score[order], away_score[order], date_ms[order].view('datetime64[ms]'),
+               stage[order]]
+    for column in columns:
+        column.setflags(write=False)
+    return GamesTable(team_names, team_to_idx, *columns)
+
+def get_games_table(filename=GAMES_FILE):
+    """Get the season's GamesTable, or None if the file is missing"""
+    try:
+        return _games_table_cached(filename, os.path.getmtime(filename))
     except FileNotFoundError:
-        return []
+        return None
 
-def get_team_conferences():
-    """Get team conference mappings"""
-    divisions = {
-        'Atlantic': ['Boston Celtics', 'Brooklyn Nets', 'New York Knicks', 'Philadelphia 76ers', 'Toronto Raptors'],
-        'Central': ['Chicago Bulls', 'Cleveland Cavaliers', 'Detroit Pistons', 'Indiana Pacers', 'Milwaukee Bucks'],
-        'Southeast': ['Atlanta Hawks', 'Charlotte Hornets', 'Miami Heat', 'Orlando Magic', 'Washington Wizards'],
-        'Northwest': ['Denver Nuggets', 'Minnesota Timberwolves', 'Oklahoma City Thunder', 'Portland Trail Blazers', 'Utah Jazz'],
-        'Pacific': ['Golden State Warriors', 'LA Clippers', 'Los Angeles Lakers', 'Phoenix Suns', 'Sacramento Kings'],
-        'Southwest': ['Dallas Mavericks', 'Houston Rockets', 'Memphis Grizzlies', 'New Orleans Pelicans', 'San Antonio Spurs']
-    }
+@lru_cache(maxsize=32)
+def _elo_snapshot(filename, k_factor_type, k_factor_value, date_filter, mtime):
+    """
+    Final (team_names, elos, records, total_games) for one parameter set, over
+    the teams that played: elos is a float array and records an (n, 2) [wins,
+    losses] array, both aligned with team_names. Cached per (parameters, file
+    mtime); the arrays are shared between requests and read-only.
+    """
+    table = _games_table_cached(filename, mtime)
+    home_idx = table.home_idx
+    away_idx = table.away_idx
+    home_score = table.home_score
+    away_score = table.away_score
     
-    team_conferences = {}
-    for conf in ['Eastern', 'Western']:
-        div_list = ['Atlantic', 'Central', 'Southeast'] if conf == 'Eastern' else ['Northwest', 'Pacific', 'Southwest']
-        for div in div_list:
-            for team in divisions.get(div, []):
-                team_conferences[team] = conf
+    # Filter games based on date
+    if date_filter == '2025_only':
+        mask = table.date.astype('datetime64[Y]') >= np.datetime64('2025', 'Y')
+        home_idx, away_idx = home_idx[mask], away_idx[mask]
+        home_score, away_score = home_score[mask], away_score[mask]
+    
+    elo_calc = EloCalculator(k_factor_type=k_factor_type, k_factor_value=k_factor_value,
+                             team_names=table.team_names)
+    
+    total_games = len(home_idx)
+    elo_calc.run_batch(home_idx, away_idx, home_score, away_score,
+                       elo_calc.get_k_factors(total_games))
+    
+    played = np.flatnonzero(elo_calc.records.sum(axis=1) > 0)
+    elos = elo_calc.elos[played]
+    records = elo_calc.records[played]
+    elos.setflags(write=False)
+    records.setflags(write=False)
+    return tuple(elo_calc.team_names[i] for i in played.tolist()), elos, records, total_games
+
+def get_elo_snapshot(k_factor_type='fixed', k_factor_value=20, date_filter='full_season', filename=GAMES_FILE):
+    """Get (team_names, elos, records, total_games) for a season, or None if there is no data"""
+    try:
+        mtime = os.path.getmtime(filename)
+    except FileNotFoundError:
+        return None
+    if _games_table_cached(filename, mtime).ids.size == 0:
+        return None
+    return _elo_snapshot(filename, k_factor_type, k_factor_value, date_filter, mtime)
+
+@lru_cache(maxsize=32)
+def _rankings(filename, k_factor_type, k_factor_value, date_filter, mtime):
+    """
+    (results, stats) payload for /api/calculate, built from the Elo snapshot.
+    Cached per (parameters, file mtime); shared between requests, do not mutate.
+    """
+    team_names, elos, records, total_games = _elo_snapshot(filename, k_factor_type, k_factor_value,
+                                                           date_filter, mtime)
+    
+    # Rank by rating (stable, so ties keep team name order) and gather columns in that order
+    order = np.argsort(-elos, kind='stable')
+    ranked_elos = np.round(elos[order], 1).tolist()
+    ranked_records = records[order].tolist()
+    
+    team_conferences = TEAM_CONFERENCES
+    results = []
+    for rank, (i, elo, (wins, losses)) in enumerate(zip(order.tolist(), ranked_elos, ranked_records), 1):
+        team = team_names[i]
+        results.append({
+            'rank': rank,
+            'team': team,
+            'elo': elo,
+            'conference': team_conferences.get(team, 'Unknown'),
+            'wins': wins,
+            'losses': losses,
+            'record': f"{wins}-{losses}"
+        })
+    
+    # Calculate statistics
+    highest_elo = float(elos.max())
+    lowest_elo = float(elos.min())
+    stats = {
+        'total_games': total_games,
+        'highest_elo': highest_elo,
+        'lowest_elo': lowest_elo,
+        'average_elo': float(elos.mean()),
+        'elo_range': highest_elo - lowest_elo
+    }
     
-    return team_conferences
+    return results, stats
+
+def get_rankings(k_factor_type='fixed', k_factor_value=20, date_filter='full_season', filename=GAMES_FILE):
+    """Get (results, stats) for a season, or None if there is no data"""
+    try:
+        mtime = os.path.getmtime(filename)
+    except FileNotFoundError:
+        return None
+    if _games_table_cached(filename, mtime).ids.size == 0:
+        return None
+    return _rankings(filename, k_factor_type, k_factor_value, date_filter, mtime)
+
+# Static league structure: division -> teams, conference -> divisions
+_DIVISIONS = {
+    'Atlantic': ('Boston Celtics', 'Brooklyn Nets', 'New York Knicks', 'Philadelphia 76ers', 'Toronto Raptors'),
+    'Central': ('Chicago Bulls', 'Cleveland Cavaliers', 'Detroit Pistons', 'Indiana Pacers', 'Milwaukee Bucks'),
+    'Southeast': ('Atlanta Hawks', 'Charlotte Hornets', 'Miami Heat', 'Orlando Magic', 'Washington Wizards'),
+    'Northwest': ('Denver Nuggets', 'Minnesota Timberwolves', 'Oklahoma City Thunder', 'Portland Trail Blazers', 'Utah Jazz'),
+    'Pacific': ('Golden State Warriors', 'LA Clippers', 'Los Angeles Lakers', 'Phoenix Suns', 'Sacramento Kings'),
+    'Southwest': ('Dallas Mavericks', 'Houston Rockets', 'Memphis Grizzlies', 'New Orleans Pelicans', 'San Antonio Spurs')
+}
+_CONF_TO_DIVS = {
+    'Eastern': ('Atlantic', 'Central', 'Southeast'),
+    'Western': ('Northwest', 'Pacific', 'Southwest')
+}
+
+# Team -> conference, built once at import (read-only)
+TEAM_CONFERENCES = MappingProxyType({team: conf
+                                     for conf, divs in _CONF_TO_DIVS.items()
+                                     for div in divs
+                                     for team in _DIVISIONS[div]})
+
+# All teams in the league, sorted by name
+_ALL_TEAMS = tuple(sorted(TEAM_CONFERENCES))
+
+def get_team_conferences():
+    """Get team conference mappings (shared, read-only)"""
+    return TEAM_CONFERENCES
 
 def calculate_win_probability(elo_a, elo_b, home_advantage=0):
     """Calculate win probability between two teams"""
     adjusted_elo_a = elo_a + home_advantage
-    prob_a = 1 / (1 + 10**((elo_b - adjusted_elo_a) / 400))
+    prob_a = 1.0 / (1.0 + math.exp((elo_b - adjusted_elo_a) * ELO_SCALE))
     return prob_a
 
+def calculate_win_probabilities(elos_a, elos_b, home_advantage=0):
+    """Vectorized calculate_win_probability over arrays of ratings"""
+    elos_a = np.asarray(elos_a, dtype=np.float64)
+    elos_b = np.asarray(elos_b, dtype=np.float64)
+    return 1.0 / (1.0 + np.exp((elos_b - (elos_a + home_advantage)) * ELO_SCALE))
+
+@lru_cache(maxsize=4096)
 def calculate_series_probability_nba_format(wins_a, wins_b, prob_a_home, prob_a_away, a_has_home_court=True, games_needed=4):
     """
     Calculate probability that team A wins a best-of-7 NBA playoff series given current standing
     Uses proper 2-2-1-1-1 home court advantage format, accounting for games already played
+    Memoized on the exact inputs, since the UI re-requests the same matchups
     wins_a: Current wins for team A
     wins_b: Current wins for team B  
     prob_a_home: Probability team A wins when they have home court
@@ -176,66 +502,30 @@ def calculate_series_probability_nba_format(wins_a, wins_b, prob_a_home, prob_a_
     # NBA playoff format: 2-2-1-1-1
     # Games where higher seed (home court advantage team) is at home: 1, 2, 5, 7
     # Games where lower seed is at home: 3, 4, 6
-    higher_seed_home_games = {1, 2, 5, 7}
-    
-    # Dynamic programming approach
-    memo = {}
-    
-    def dp(a_wins, b_wins, current_game):
-        if a_wins >= games_needed:
-            return 1.0
-        if b_wins >= games_needed:
-            return 0.0
-        
-        if current_game > 7:  # Series can't go beyond 7 games
-            return 0.0
-        
-        if (a_wins, b_wins, current_game) in memo:
-            return memo[(a_wins, b_wins, current_game)]
-        
-        # Determine if team A is playing at home in this specific game
-        if a_has_home_court:
-            # Team A has home court advantage (higher seed)
-            a_at_home = current_game in higher_seed_home_games
-        else:
-            # Team B has home court advantage (higher seed)
-            a_at_home = current_game not in higher_seed_home_games
-        
-        # Get probability for this specific game
-        prob_a_this_game = prob_a_home if a_at_home else prob_a_away
-        
-        # Team A wins this game OR loses this game
-        result = (prob_a_this_game * dp(a_wins + 1, b_wins, current_game + 1) + 
-                 (1 - prob_a_this_game) * dp(a_wins, b_wins + 1, current_game + 1))
-        
-        memo[(a_wins, b_wins, current_game)] = result
-        return result
-    
-    # Start from the next game to be played
-    next_game_number = wins_a + wins_b + 1
-    return dp(wins_a, wins_b, next_game_number)
+    # Bottom-up table over (a_wins, b_wins), starting from the next game to be played
+    return float(series_win_probability(int(wins_a), int(wins_b), float(prob_a_home), float(prob_a_away),
+                                        bool(a_has_home_court), int(games_needed)))
 
 def get_remaining_games_breakdown(wins_a, wins_b, a_has_home_court):
     """
     Get breakdown of remaining home/away games for both teams
     """
     games_played = wins_a + wins_b
-    higher_seed_home_games = {1, 2, 5, 7}
     
     remaining_games = list(range(games_played + 1, 8))  # Games still to be played
     
+    # Same 2-2-1-1-1 table the series kernel uses (index = game number)
+    higher_seed_remaining_home = int(HIGHER_SEED_HOME[games_played + 1:8].sum())
+    
     if a_has_home_court:
         # Team A is higher seed
-        a_remaining_home = sum(1 for game in remaining_games if game in higher_seed_home_games)
-        a_remaining_away = len(remaining_games) - a_remaining_home
-        b_remaining_home = a_remaining_away
-        b_remaining_away = a_remaining_home
+        a_remaining_home = higher_seed_remaining_home
     else:
         # Team B is higher seed
-        a_remaining_home = sum(1 for game in remaining_games if game not in higher_seed_home_games)
-        a_remaining_away = len(remaining_games) - a_remaining_home
-        b_remaining_home = a_remaining_away
-        b_remaining_away = a_remaining_home
+        a_remaining_home = len(remaining_games) - higher_seed_remaining_home
+    a_remaining_away = len(remaining_games) - a_remaining_home
+    b_remaining_home = a_remaining_away
+    b_remaining_away = a_remaining_home
     
     return {
         'a_remaining_home': a_remaining_home,
@@ -259,59 +549,13 @@ def calculate_elo():
     k_factor_value = data.get('k_factor_value', 20)
     date_filter = data.get('date_filter', 'full_season')
     
-    # Load games
-    all_games = load_games_data()
+    # Ranked table and stats for these parameters (cached per season file version)
+    rankings = get_rankings(k_factor_type, k_factor_value, date_filter)
     
-    if not all_games:
+    if rankings is None:
         return jsonify({'error': 'No games data found'}), 400
     
-    # Filter games based on date
-    if date_filter == '2025_only':
-        filtered_games = [g for g in all_games if g['date'].year >= 2025]
-    else:
-        filtered_games = all_games
-    
-    # Initialize calculator
-    elo_calc = EloCalculator(k_factor_type=k_factor_type, k_factor_value=k_factor_value)
-    
-    # Process games
-    total_games = len(filtered_games)
-    for i, game in enumerate(filtered_games):
-        elo_calc.update_elo(
-            game['home_team'], 
-            game['visitor_team'],
-            game['home_score'], 
-            game['visitor_score'],
-            i + 1,
-            total_games
-        )
-    
-    # Prepare results
-    team_conferences = get_team_conferences()
-    sorted_teams = sorted(elo_calc.team_elos.items(), key=lambda x: x[1], reverse=True)
-    
-    results = []
-    for rank, (team, elo) in enumerate(sorted_teams, 1):
-        record = elo_calc.team_records[team]
-        results.append({
-            'rank': rank,
-            'team': team,
-            'elo': round(elo, 1),
-            'conference': team_conferences.get(team, 'Unknown'),
-            'wins': record['wins'],
-            'losses': record['losses'],
-            'record': f"{record['wins']}-{record['losses']}"
-        })
-    
-    # Calculate statistics
-    elos = [team[1] for team in sorted_teams]
-    stats = {
-        'total_games': total_games,
-        'highest_elo': max(elos),
-        'lowest_elo': min(elos),
-        'average_elo': sum(elos) / len(elos),
-        'elo_range': max(elos) - min(elos)
-    }
+    results, stats = rankings
     
     return jsonify({
         'results': results,
@@ -336,6 +580,27 @@ def win_probability():
     if not all([team_a, team_b, elo_a, elo_b]):
         return jsonify({'error': 'Missing required parameters'}), 400
     
+    # Lists of ratings: evaluate every matchup at once
+    if isinstance(elo_a, list) or isinstance(elo_b, list):
+        try:
+            elos_a, elos_b = np.broadcast_arrays(np.asarray(elo_a, dtype=np.float64),
+                                                 np.asarray(elo_b, dtype=np.float64))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'elo_a and elo_b must be numbers or equal-length lists'}), 400
+        
+        scenarios = {}
+        for name, home_advantage in (('neutral_court', 0), ('team_a_home', 40), ('team_b_home', -40)):
+            prob_a = calculate_win_probabilities(elos_a, elos_b, home_advantage)
+            scenarios[name] = {'prob_a': np.round(prob_a * 100, 1), 'prob_b': np.round((1 - prob_a) * 100, 1)}
+        
+        return jsonify({
+            'team_a': team_a,
+            'team_b': team_b,
+            'elo_a': elo_a,
+            'elo_b': elo_b,
+            **scenarios
+        })
+    
     # Calculate probabilities
     neutral_prob_a = calculate_win_probability(elo_a, elo_b)
     home_prob_a = calculate_win_probability(elo_a, elo_b, home_advantage=40)
@@ -426,17 +691,39 @@ def series_probability():
         'format_explanation': f"NBA 2-2-1-1-1 format: {higher_seed} has home court advantage"
     })
 
+@app.route('/api/elo_snapshot')
+def elo_snapshot():
+    """Get final ratings and records for all teams, for client-side pairwise probabilities"""
+    k_factor_type = request.args.get('k_factor_type', 'fixed')
+    k_factor_value = request.args.get('k_factor_value', 20, type=float)
+    date_filter = request.args.get('date_filter', 'full_season')
+    
+    snapshot = get_elo_snapshot(k_factor_type, k_factor_value, date_filter)
+    
+    if snapshot is None:
+        return jsonify({'error': 'No games data found'}), 400
+    
+    team_names, elos, records, total_games = snapshot
+    
+    return jsonify({
+        'elos': dict(zip(team_names, elos.tolist())),
+        'records': {team: {'wins': wins, 'losses': losses}
+                    for team, (wins, losses) in zip(team_names, records.tolist())},
+        'total_games': total_games,
+        # Win probability is 1 / (1 + 10 ** ((elo_b - elo_a - home_advantage) / 400))
+        'home_advantage': 40,
+        'parameters': {
+            'k_factor_type': k_factor_type,
+            'k_factor_value': k_factor_value,
+            'date_filter': date_filter
+        }
+    })
+
 @app.route('/api/teams')
 def get_teams():
     """Get list of all teams"""
-    all_games = load_games_data()
-    teams = set()
-    for game in all_games:
-        teams.add(game['home_team'])
-        teams.add(game['visitor_team'])
-    
     return jsonify({
-        'teams': sorted(list(teams))
+        'teams': _ALL_TEAMS
     })
 
 if __name__ == '__main__':
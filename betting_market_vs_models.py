@@ -73,16 +73,37 @@ class BettingOddsConverter:
             
         Returns:
             American odds format
+            
+        Raises:
+            ValueError: If the probability is not strictly between 0 and 1
+                (0% and 100%), where the odds are infinite
         """
         # Convert percentage to decimal if needed
         if probability > 1:
             probability = probability / 100
+        
+        if not 0 < probability < 1:
+            raise ValueError("Probabilities must be strictly between 0 and 1 (0% and 100%)")
             
         if probability >= 0.5:
             return int(-100 * probability / (1 - probability))
         else:
             return int(100 * (1 - probability) / probability)
     
+    @staticmethod
+    def probabilities_to_american(probabilities) -> List[int]:
+        """
+        probability_to_american for each of a sequence of probabilities.
+        
+        Args:
+            probabilities: Sequence of probabilities, each as decimal (0-1) or
+                percentage (0-100)
+            
+        Returns:
+            List of American odds (int)
+        """
+        return [BettingOddsConverter.probability_to_american(p) for p in probabilities]
+    
     @staticmethod
     def decimal_to_american(decimal_odds: float) -> int:
         """Convert decimal odds to American odds."""
@@ -178,8 +199,9 @@ class FinalsAnalyzer:
         report.append(f"{'Model/Source':<28} {f'{self.team_a} Win %':<12} {'Implied Odds':<12} {f'{self.team_b} Win %'}")
         report.append("-" * 80)
         
-        for estimate in self.estimates:
-            odds = BettingOddsConverter.probability_to_american(estimate.team_a_probability)
+        implied_odds = BettingOddsConverter.probabilities_to_american(
+            [estimate.team_a_probability for estimate in self.estimates])
+        for estimate, odds in zip(self.estimates, implied_odds):
             report.append(
                 f"{estimate.model_type.value:<28} "
                 f"{estimate.team_a_probability:>6.1f}%      "
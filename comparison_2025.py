@@ -3,81 +3,41 @@
 NBA Elo 2025 Comparison - Beautiful display comparing full season vs 2025-only
 """
 
+from rankings_data import FULL_SEASON_KDOWN, Y2025_KDOWN, TEAM_EMOJI
+
 def print_2025_summary():
     """Print the 2025-only Elo results with nice formatting"""
     
-    # 2025-only rankings (from our calculation)
-    rankings_2025 = [
-        ("Oklahoma City Thunder", 1248.8, "🏆"),
-        ("Cleveland Cavaliers", 1156.8, "🥇"),
-        ("Minnesota Timberwolves", 1150.8, "🔥"),
-        ("Boston Celtics", 1150.8, "🥈"),
-        ("Indiana Pacers", 1146.8, "📈"),
-        ("LA Clippers", 1112.6, "💪"),
-        ("Denver Nuggets", 1104.3, "⭐"),
-        ("Golden State Warriors", 1084.7, "👑"),
-        ("Houston Rockets", 1069.4, "🚀"),
-        ("Milwaukee Bucks", 1068.0, "🦌"),
-        ("Los Angeles Lakers", 1067.0, "👑"),
-        ("New York Knicks", 1064.9, "🗽"),
-        ("Detroit Pistons", 1061.6, "🔧"),
-        ("Portland Trail Blazers", 1020.7, "🌲"),
-        ("Chicago Bulls", 1009.1, "🐂"),
-        ("Memphis Grizzlies", 1006.2, "🐻"),
-        ("Sacramento Kings", 988.5, "👑"),
-        ("Orlando Magic", 979.5, "✨"),
-        ("Miami Heat", 958.4, "🔥"),
-        ("Atlanta Hawks", 946.2, "🦅"),
-        ("Phoenix Suns", 941.7, "☀️"),
-        ("Toronto Raptors", 936.2, "🦖"),
-        ("San Antonio Spurs", 919.7, "⚡"),
-        ("Dallas Mavericks", 913.3, "🐴"),
-        ("New Orleans Pelicans", 868.9, "🦢"),
-        ("Brooklyn Nets", 841.4, "🕸️"),
-        ("Utah Jazz", 811.2, "🎵"),
-        ("Philadelphia 76ers", 796.1, "🔔"),
-        ("Charlotte Hornets", 790.8, "🐝"),
-        ("Washington Wizards", 785.4, "🧙"),
-    ]
+    # 2025-only rankings (from our calculation), top 15
+    teams_2025 = Y2025_KDOWN.teams[:15]
+    elos_2025 = Y2025_KDOWN.elos[:15]
     
-    # Full season rankings for comparison
-    full_season = [
-        ("Oklahoma City Thunder", 1286.2),
-        ("Cleveland Cavaliers", 1196.4),
-        ("Boston Celtics", 1184.6),
-        ("Minnesota Timberwolves", 1154.2),
-        ("Indiana Pacers", 1146.9),
-        ("LA Clippers", 1118.9),
-        ("Denver Nuggets", 1111.0),
-        ("New York Knicks", 1097.1),
-        ("Houston Rockets", 1095.4),
-        ("Golden State Warriors", 1085.8),
-        ("Milwaukee Bucks", 1072.1),
-        ("Los Angeles Lakers", 1064.4),
-    ]
+    # Full season rankings for comparison (0 where a team isn't in its top 12)
+    full_season_dict = dict(zip(FULL_SEASON_KDOWN.teams[:12], FULL_SEASON_KDOWN.elos[:12]))
+    full_elos = [full_season_dict.get(team, 0.0) for team in teams_2025]
+    diffs = [elo - full if full > 0 else 0.0 for elo, full in zip(elos_2025, full_elos)]
     
-    print("🏀 NBA ELO COMPARISON - 2025 GAMES ONLY vs FULL SEASON")
-    print("="*80)
-    print("📊 METHODOLOGY:")
-    print("• 2025 Only: 834 games from Jan 1 - Jun 6, 2025")
-    print("• All teams reset to 1,000 Elo at start of 2025")
-    print("• Same decreasing K-factor (40→10) and margin scaling")
-    print("="*80)
+    lines = []
+    lines.append("🏀 NBA ELO COMPARISON - 2025 GAMES ONLY vs FULL SEASON")
+    lines.append("="*80)
+    lines.append("📊 METHODOLOGY:")
+    lines.append("• 2025 Only: 834 games from Jan 1 - Jun 6, 2025")
+    lines.append("• All teams reset to 1,000 Elo at start of 2025")
+    lines.append("• Same decreasing K-factor (40→10) and margin scaling")
+    lines.append("="*80)
     
-    print(f"\n{'2025-ONLY ELO RANKINGS':^80}")
-    print("="*80)
-    print(f"{'Rank':<4} {'Team':<30} {'2025 Elo':<10} {'Full Season':<12} {'Diff':<8}")
-    print("-"*80)
+    lines.append(f"\n{'2025-ONLY ELO RANKINGS':^80}")
+    lines.append("="*80)
+    lines.append(f"{'Rank':<4} {'Team':<30} {'2025 Elo':<10} {'Full Season':<12} {'Diff':<8}")
+    lines.append("-"*80)
     
-    # Create lookup for full season rankings
-    full_season_dict = {team: elo for team, elo in full_season}
-    
-    for rank, (team, elo_2025, emoji) in enumerate(rankings_2025[:15], 1):
-        full_elo = full_season_dict.get(team, 0)
-        diff = elo_2025 - full_elo if full_elo > 0 else 0
+    row = "{:<4} {} {:<27} {:>8.1f} {:>10.1f} {:>7}".format
+    for rank, (team, elo_2025, full_elo, diff) in enumerate(
+            zip(teams_2025, elos_2025, full_elos, diffs), 1):
         diff_str = f"{diff:+.1f}" if diff != 0 else "N/A"
-        
-        print(f"{rank:<4} {emoji} {team:<27} {elo_2025:>8.1f} {full_elo:>10.1f} {diff_str:>7}")
+        lines.append(row(rank, TEAM_EMOJI[team], team, elo_2025, full_elo, diff_str))
+    
+    print("\n".join(lines))
 
 def print_key_differences():
     """Print key differences between full season and 2025-only"""
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+NBA Elo Constants - Folded factors of the Elo formulas, shared by the kernel and the scripts
+Plain math only, so the one-shot scripts can import them without NumPy or numba:
+they replay a season in a plain Python loop, which takes a few milliseconds,
+far less than importing either library would add to a one-shot run
+"""
+
+import math
+
+# 10 ** (x / 400) == exp(x * ELO_SCALE); exp is cheaper than a general pow
+ELO_SCALE = math.log(10.0) / 400.0
+
+# Margin-of-victory multiplier: log(diff + 1) / log(20) == log(diff + 1) * INV_LOG20
+INV_LOG20 = 1.0 / math.log(20.0)
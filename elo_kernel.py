@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+NBA Elo Kernel
+Compiled sequential Elo update used by the web app's season replays
+"""
+
+import math
+import numpy as np
+
+from elo_constants import ELO_SCALE, INV_LOG20
+
+try:
+    from numba import njit
+except ImportError:
+    # numba not installed: run the same kernels as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Margin-of-victory multiplier, tabulated for the score differentials that
+# actually occur (larger ones fall back to libm)
+MOV_TABLE = np.array([math.log(d + 1) * INV_LOG20 for d in range(128)])
+
+def game_weights(home_score, away_score, k):
+    """
+    Per-game inputs for fold_elo, computed as whole vectors:
+    home_won (1/0) and weight = K-factor * margin-of-victory multiplier.
+    """
+    diff = home_score - away_score
+    home_won = (diff > 0).astype(np.int64)
+    margin = np.abs(diff)
+    mov = MOV_TABLE[np.minimum(margin, MOV_TABLE.shape[0] - 1)]
+    large = margin >= MOV_TABLE.shape[0]
+    if large.any():
+        mov[large] = np.log(margin[large] + 1.0) * INV_LOG20
+    return home_won, k * mov
+
+@njit(cache=True, fastmath=True)
+def fold_elo(home_idx, away_idx, home_won, weight, ratings, records, history):
+    """
+    Apply a run of games to ratings and records in place, in order.
+    home_idx/away_idx index into ratings; home_won and weight come from
+    game_weights. records is an (n_teams, 2) array of [wins, losses] counts.
+    If history has a row per game, the home and away ratings after each game
+    are written to it; pass an empty (0, 2) array to skip that.
+    The away team's change is the negation of the home team's, since
+    actual_b - expected_b == -(actual_a - expected_a).
+    """
+    track = history.shape[0] > 0
+    for i in range(home_idx.shape[0]):
+        a = home_idx[i]
+        b = away_idx[i]
+        ra = ratings[a]
+        rb = ratings[b]
+        ea = 1.0 / (1.0 + math.exp((rb - ra) * ELO_SCALE))
+        won = home_won[i]
+        # Winner's column 0 and loser's column 1, without branching on who won
+        records[a, 1 - won] += 1
+        records[b, won] += 1
+        delta = weight[i] * (won - ea)
+        ratings[a] = ra + delta
+        ratings[b] = rb - delta
+        if track:
+            history[i, 0] = ra + delta
+            history[i, 1] = rb - delta
+    return ratings
+
+# NBA 2-2-1-1-1 format: True where the higher seed hosts game n (index = game number)
+HIGHER_SEED_HOME = np.array([False, True, True, False, False, True, False, True])
+
+@njit(cache=True)
+def series_win_probability(wins_a, wins_b, prob_a_home, prob_a_away, a_has_home_court, games_needed):
+    """
+    Probability that team A wins the series from (wins_a, wins_b).
+    Fills a small (wins, wins) table bottom-up; game number is a_wins + b_wins + 1.
+    """
+    table = np.zeros((games_needed + 1, games_needed + 1))
+    for b in range(games_needed):
+        table[games_needed, b] = 1.0
+    
+    for a in range(games_needed - 1, wins_a - 1, -1):
+        for b in range(games_needed - 1, wins_b - 1, -1):
+            game = a + b + 1
+            if game > 7:  # Series can't go beyond 7 games
+                continue
+            a_at_home = HIGHER_SEED_HOME[game] == a_has_home_court
+            p = prob_a_home if a_at_home else prob_a_away
+            table[a, b] = p * table[a + 1, b] + (1.0 - p) * table[a, b + 1]
+    return table[wins_a, wins_b]
+
+def warmup():
+    """Compile the kernels for the argument types the app uses"""
+    idx = np.zeros(1, dtype=np.intp)
+    home_won, weight = game_weights(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), np.zeros(1))
+    records = np.zeros((1, 2), dtype=np.int64)
+    fold_elo(idx, idx, home_won, weight, np.zeros(1), records, np.zeros((0, 2)))
+    # Full-season replays pass the shared read-only team index arrays, a separate specialization
+    idx.setflags(write=False)
+    fold_elo(idx, idx, home_won, weight, np.zeros(1), records, np.zeros((0, 2)))
+    series_win_probability(0, 0, 0.5, 0.5, True, 4)
@@ -3,6 +3,8 @@
 NBA Elo Summary - Final beautiful display of results
 """
 
+from rankings_data import FULL_SEASON_KDOWN, western_mask, with_emoji
+
 def print_methodology():
     """Print the Elo calculation methodology"""
     print("🏀 NBA ELO RATING SYSTEM - 2024 SEASON")
@@ -19,40 +21,29 @@ def print_elite_tiers():
     """Print teams in elite performance tiers"""
     
     # Elo tiers based on final ratings
-    elite_tier = [
-        ("Oklahoma City Thunder", 1286.2, "🏆"),
-        ("Cleveland Cavaliers", 1196.4, "🥇"),
-        ("Boston Celtics", 1184.6, "🥈"),
-    ]
+    elite_tier = with_emoji(FULL_SEASON_KDOWN, stop=3)
     
-    great_tier = [
-        ("Minnesota Timberwolves", 1154.2, "🔥"),
-        ("Indiana Pacers", 1146.9, "📈"),
-        ("LA Clippers", 1118.9, "💪"),
-        ("Denver Nuggets", 1111.0, "⭐"),
-    ]
+    great_tier = with_emoji(FULL_SEASON_KDOWN, 3, 7)
     
-    good_tier = [
-        ("New York Knicks", 1097.1, "🗽"),
-        ("Houston Rockets", 1095.4, "🚀"),
-        ("Golden State Warriors", 1085.8, "👑"),
-        ("Milwaukee Bucks", 1072.1, "🦌"),
-    ]
+    good_tier = with_emoji(FULL_SEASON_KDOWN, 7, 11)
     
-    print(f"\n{'ELITE TIER (1150+ Elo)':^70}")
-    print("="*70)
+    lines = []
+    lines.append(f"\n{'ELITE TIER (1150+ Elo)':^70}")
+    lines.append("="*70)
     for team, elo, emoji in elite_tier:
-        print(f"{emoji} {team:<35} {elo:>8.1f}")
+        lines.append(f"{emoji} {team:<35} {elo:>8.1f}")
     
-    print(f"\n{'GREAT TIER (1100-1149 Elo)':^70}")
-    print("="*70)
+    lines.append(f"\n{'GREAT TIER (1100-1149 Elo)':^70}")
+    lines.append("="*70)
     for team, elo, emoji in great_tier:
-        print(f"{emoji} {team:<35} {elo:>8.1f}")
+        lines.append(f"{emoji} {team:<35} {elo:>8.1f}")
     
-    print(f"\n{'GOOD TIER (1070-1099 Elo)':^70}")
-    print("="*70)
+    lines.append(f"\n{'GOOD TIER (1070-1099 Elo)':^70}")
+    lines.append("="*70)
     for team, elo, emoji in good_tier:
-        print(f"{emoji} {team:<35} {elo:>8.1f}")
+        lines.append(f"{emoji} {team:<35} {elo:>8.1f}")
+    
+    print("\n".join(lines))
 
 def print_playoff_impact():
     """Print biggest playoff movers"""
@@ -73,34 +64,41 @@ def print_playoff_impact():
         ("Chicago Bulls", "-10.0", "🐂 Couldn't maintain pace"),
     ]
     
-    print(f"\n{'BIGGEST PLAYOFF GAINERS':^70}")
-    print("="*70)
+    lines = []
+    lines.append(f"\n{'BIGGEST PLAYOFF GAINERS':^70}")
+    lines.append("="*70)
     for team, change, note in biggest_gainers:
-        print(f"📈 {team:<25} {change:>6} - {note}")
+        lines.append(f"📈 {team:<25} {change:>6} - {note}")
     
-    print(f"\n{'BIGGEST PLAYOFF DECLINES':^70}")
-    print("="*70)
+    lines.append(f"\n{'BIGGEST PLAYOFF DECLINES':^70}")
+    lines.append("="*70)
     for team, change, note in biggest_declines:
-        print(f"📉 {team:<25} {change:>6} - {note}")
+        lines.append(f"📉 {team:<25} {change:>6} - {note}")
+    
+    print("\n".join(lines))
 
 def print_conference_summary():
     """Print conference strength analysis"""
     
-    east_avg = (1196.4 + 1184.6 + 1146.9 + 1097.1 + 1072.1 + 1049.3 + 988.1 + 
-                986.9 + 975.3 + 956.3 + 904.2 + 823.1 + 810.2 + 753.1 + 741.4) / 15
-    
-    west_avg = (1286.2 + 1154.2 + 1118.9 + 1111.0 + 1095.4 + 1085.8 + 1064.4 + 
-                1047.7 + 990.2 + 985.8 + 951.4 + 937.4 + 925.7 + 815.6 + 788.9) / 15
-    
-    print(f"\n{'CONFERENCE STRENGTH ANALYSIS':^70}")
-    print("="*70)
-    print(f"🏀 Eastern Conference Average Elo: {east_avg:.1f}")
-    print(f"🏀 Western Conference Average Elo: {west_avg:.1f}")
-    print(f"🏀 Western Conference Advantage: +{west_avg - east_avg:.1f} Elo points")
-    
-    print(f"\nTop 5 Teams by Conference:")
-    print(f"🌟 Eastern: CLE(1196) BOS(1185) IND(1147) NYK(1097) MIL(1072)")
-    print(f"🌟 Western: OKC(1286) MIN(1154) LAC(1119) DEN(1111) HOU(1095)")
+    # Averages over all 30 teams of the full-season table
+    west = western_mask(FULL_SEASON_KDOWN)
+    east_elos = [elo for elo, is_west in zip(FULL_SEASON_KDOWN.elos, west) if not is_west]
+    west_elos = [elo for elo, is_west in zip(FULL_SEASON_KDOWN.elos, west) if is_west]
+    east_avg = sum(east_elos) / len(east_elos)
+    west_avg = sum(west_elos) / len(west_elos)
+    
+    lines = []
+    lines.append(f"\n{'CONFERENCE STRENGTH ANALYSIS':^70}")
+    lines.append("="*70)
+    lines.append(f"🏀 Eastern Conference Average Elo: {east_avg:.1f}")
+    lines.append(f"🏀 Western Conference Average Elo: {west_avg:.1f}")
+    lines.append(f"🏀 Western Conference Advantage: +{west_avg - east_avg:.1f} Elo points")
+    
+    lines.append(f"\nTop 5 Teams by Conference:")
+    lines.append(f"🌟 Eastern: CLE(1196) BOS(1185) IND(1147) NYK(1097) MIL(1072)")
+    lines.append(f"🌟 Western: OKC(1286) MIN(1154) LAC(1119) DEN(1111) HOU(1095)")
+    
+    print("\n".join(lines))
 
 def print_fun_facts():
     """Print interesting facts and insights"""
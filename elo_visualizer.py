@@ -3,15 +3,41 @@
 NBA Elo Visualizer - Creates detailed displays and exports data
 """
 
-import json
+from array import array
 import csv
-from datetime import datetime
-from collections import defaultdict
+import math
+import os
+import pickle
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+import orjson
+
+from elo_constants import ELO_SCALE, INV_LOG20
+
+GAMES_FILE = 'nba_2024_games.json'
+# Parsed games, reused while the source file's mtime is unchanged;
+# bump the version when the cached record layout changes
+GAMES_CACHE_FILE = 'nba_2024_games.pkl'
+GAMES_CACHE_VERSION = 2
 
 def load_games():
-    """Load games from JSON file"""
-    with open('nba_2024_games.json', 'r') as f:
-        data = json.load(f)
+    """Load games from JSON file (or the pickled cache of a previous run)"""
+    src_mtime = os.path.getmtime(GAMES_FILE)
+    try:
+        with open(GAMES_CACHE_FILE, 'rb') as f:
+            cache_key, games = pickle.load(f)
+        if cache_key == (GAMES_CACHE_VERSION, src_mtime):
+            # Unpickled names are shared per team but not interned; re-intern them
+            for game in games:
+                game['home_team'] = sys.intern(game['home_team'])
+                game['visitor_team'] = sys.intern(game['visitor_team'])
+            return games
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+    
+    with open(GAMES_FILE, 'rb') as f:
+        data = orjson.loads(f.read())
     
     games = []
     for game in data['response']:
@@ -21,19 +47,27 @@ def load_games():
             
             games.append({
                 'id': game['id'],
-                'date': datetime.fromisoformat(game['date']['start'].replace('Z', '+00:00')),
+                'date': game['date']['start'],  # ISO 8601 UTC string
                 'stage': game['stage'],
-                'home_team': game['teams']['home']['name'],
-                'visitor_team': game['teams']['visitors']['name'],
+                'home_team': sys.intern(game['teams']['home']['name']),
+                'visitor_team': sys.intern(game['teams']['visitors']['name']),
                 'home_score': int(game['scores']['home']['points']),
                 'visitor_score': int(game['scores']['visitors']['points'])
             })
     
+    # Sort by the ISO date strings (see nba_elo_calculator.load_and_process_games)
     games.sort(key=lambda x: x['date'])
+    
+    try:
+        with open(GAMES_CACHE_FILE, 'wb') as f:
+            pickle.dump(((GAMES_CACHE_VERSION, src_mtime), games), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Read-only checkout: just parse again next time
     return games
 
+@lru_cache(maxsize=1)
 def create_conference_divisions():
-    """Create team conference and division mappings"""
+    """Create team conference and division mappings (built once, read-only)"""
     # NBA team divisions (2024 season)
     divisions = {
         # Eastern Conference
@@ -47,10 +81,11 @@ def create_conference_divisions():
         'Southwest': ['Dallas Mavericks', 'Houston Rockets', 'Memphis Grizzlies', 'New Orleans Pelicans', 'San Antonio Spurs']
     }
     
+    # Team names are interned, as in load_games, so lookups by a game's team hit on identity
     team_divisions = {}
     for division, teams in divisions.items():
         for team in teams:
-            team_divisions[team] = division
+            team_divisions[sys.intern(team)] = division
     
     conferences = {
         'Eastern': ['Atlantic', 'Central', 'Southeast'],
@@ -61,196 +96,150 @@ def create_conference_divisions():
     for conference, divs in conferences.items():
         for div in divs:
             for team in divisions.get(div, []):
-                team_conferences[team] = conference
+                team_conferences[sys.intern(team)] = conference
                 
-    return team_divisions, team_conferences
+    return MappingProxyType(team_divisions), MappingProxyType(team_conferences)
 
 def calculate_detailed_elo():
     """Calculate Elo with detailed tracking"""
     games = load_games()
     
-    # Initialize
-    elos = defaultdict(lambda: 1000.0)
-    elo_history = defaultdict(list)
-    
     regular_season_games = [g for g in games if g['stage'] <= 2]
     playoff_games = [g for g in games if g['stage'] == 3]
-    
-    # Process regular season
-    for i, game in enumerate(regular_season_games):
-        # Calculate K-factor (decreasing over time)
-        progress = i / len(regular_season_games)
-        k = 40 * (1 - progress * 0.75) + 10 * progress * 0.75
-        k = max(k, 10)
-        
-        # Update Elo
-        home_elo = elos[game['home_team']]
-        away_elo = elos[game['visitor_team']]
+    season_games = regular_season_games + playoff_games
+    n_regular = len(regular_season_games)
+    
+    # Encode teams as integer ids in order of first appearance
+    team_to_idx = {}
+    for game in regular_season_games:
+        team_to_idx.setdefault(game['home_team'], len(team_to_idx))
+        team_to_idx.setdefault(game['visitor_team'], len(team_to_idx))
+    n_regular_teams = len(team_to_idx)
+    for game in playoff_games:
+        team_to_idx.setdefault(game['home_team'], len(team_to_idx))
+        team_to_idx.setdefault(game['visitor_team'], len(team_to_idx))
+    teams = list(team_to_idx)
+    
+    # One pass over the regular season then the playoffs, on plain lists
+    elos = [1000.0] * len(teams)
+    # History as per-team columns of date, rating after the game and stage. The
+    # stored ratings are float32 (ample for ~1000-1300 values); the live ratings
+    # above stay float64.
+    history_dates = [[] for _ in teams]
+    history_elos = [array('f') for _ in teams]
+    history_stages = [[] for _ in teams]
+    
+    n_games = len(games)
+    regular_season_elos = None
+    for i, game in enumerate(season_games):
+        if i == n_regular:
+            regular_season_elos = dict(zip(teams[:n_regular_teams], elos))
         
-        # Expected scores
-        home_expected = 1 / (1 + 10**((away_elo - home_elo) / 400))
-        away_expected = 1 - home_expected
-        
-        # Actual results
-        if game['home_score'] > game['visitor_score']:
-            home_actual, away_actual = 1, 0
-        else:
-            home_actual, away_actual = 0, 1
-            
-        # Margin of victory multiplier
-        import math
-        score_diff = abs(game['home_score'] - game['visitor_score'])
-        mov_multiplier = math.log(score_diff + 1) / math.log(20)
+        # K-factor decreasing over time; the playoffs continue the schedule over all games.
+        # 40 * (1 - 0.75p) + 10 * 0.75p, folded to 40 - 22.5p
+        progress = i / n_regular if i < n_regular else i / n_games
+        k = max(40.0 - 22.5 * progress, 10.0)
         
-        # Update
-        elos[game['home_team']] += k * mov_multiplier * (home_actual - home_expected)
-        elos[game['visitor_team']] += k * mov_multiplier * (away_actual - away_expected)
+        h = team_to_idx[game['home_team']]
+        a = team_to_idx[game['visitor_team']]
+        home_score = game['home_score']
+        away_score = game['visitor_score']
         
-        # Store history
-        elo_history[game['home_team']].append({
-            'date': game['date'],
-            'elo': elos[game['home_team']],
-            'stage': 'Regular Season'
-        })
-        elo_history[game['visitor_team']].append({
-            'date': game['date'],
-            'elo': elos[game['visitor_team']],
-            'stage': 'Regular Season'
-        })
-    
-    regular_season_elos = dict(elos)
-    
-    # Process playoffs
-    for i, game in enumerate(playoff_games):
-        progress = (len(regular_season_games) + i) / len(games)
-        k = 40 * (1 - progress * 0.75) + 10 * progress * 0.75
-        k = max(k, 10)
+        # Expected score, margin-of-victory weight, and one shared delta
+        home_expected = 1.0 / (1.0 + math.exp((elos[a] - elos[h]) * ELO_SCALE))
+        weight = k * math.log(abs(home_score - away_score) + 1) * INV_LOG20
+        delta = weight * (int(home_score > away_score) - home_expected)
+        elos[h] += delta
+        elos[a] -= delta
         
-        home_elo = elos[game['home_team']]
-        away_elo = elos[game['visitor_team']]
-        
-        home_expected = 1 / (1 + 10**((away_elo - home_elo) / 400))
-        away_expected = 1 - home_expected
-        
-        if game['home_score'] > game['visitor_score']:
-            home_actual, away_actual = 1, 0
-        else:
-            home_actual, away_actual = 0, 1
-            
-        import math
-        score_diff = abs(game['home_score'] - game['visitor_score'])
-        mov_multiplier = math.log(score_diff + 1) / math.log(20)
-        
-        elos[game['home_team']] += k * mov_multiplier * (home_actual - home_expected)
-        elos[game['visitor_team']] += k * mov_multiplier * (away_actual - away_expected)
-        
-        elo_history[game['home_team']].append({
-            'date': game['date'],
-            'elo': elos[game['home_team']],
-            'stage': 'Playoffs'
-        })
-        elo_history[game['visitor_team']].append({
-            'date': game['date'],
-            'elo': elos[game['visitor_team']],
-            'stage': 'Playoffs'
-        })
-    
-    return dict(elos), regular_season_elos, elo_history
+        stage = 'Regular Season' if i < n_regular else 'Playoffs'
+        for team_id in (h, a):
+            history_dates[team_id].append(game['date'])
+            history_elos[team_id].append(elos[team_id])
+            history_stages[team_id].append(stage)
+    
+    if regular_season_elos is None:  # No playoff games yet
+        regular_season_elos = dict(zip(teams[:n_regular_teams], elos))
+    
+    elo_history = {
+        team: {'date': dates, 'elo': team_elos, 'stage': stages}
+        for team, dates, team_elos, stages in zip(teams, history_dates, history_elos, history_stages)
+    }
+    
+    return dict(zip(teams, elos)), regular_season_elos, elo_history
+
+# Row of the conference ranking tables: rank, team, division, Elo, playoff change
+_RANKING_ROW = "{:<4} {:<25} {:<12} {:>7.1f} {:>9}".format
+
+def _ranking_rows(team_rows, show_division=True):
+    """Format ranked (team, division, elo, change) rows as one block of table lines"""
+    lines = []
+    for i, (team, division, elo, change) in enumerate(team_rows, 1):
+        change_str = f"+{change:.1f}" if change >= 0 else f"{change:.1f}"
+        lines.append(_RANKING_ROW(i, team, division if show_division else 'N/A', elo, change_str))
+    return "\n".join(lines)
 
 def display_conference_rankings(final_elos, regular_elos):
     """Display rankings by conference and division"""
     team_divisions, team_conferences = create_conference_divisions()
     
     # Group teams by conference
-    east_teams = []
-    west_teams = []
-    other_teams = []
-    
+    by_conference = {'Eastern': [], 'Western': [], 'Other': []}
     for team, elo in final_elos.items():
-        conf = team_conferences.get(team)
-        div = team_divisions.get(team, 'Unknown')
-        reg_elo = regular_elos.get(team, 1000)
-        change = elo - reg_elo
-        
-        team_data = {
-            'team': team,
-            'elo': elo,
-            'division': div,
-            'change': change
-        }
-        
-        if conf == 'Eastern':
-            east_teams.append(team_data)
-        elif conf == 'Western':
-            west_teams.append(team_data)
-        else:
-            other_teams.append(team_data)
-    
-    # Sort by Elo
-    east_teams.sort(key=lambda x: x['elo'], reverse=True)
-    west_teams.sort(key=lambda x: x['elo'], reverse=True)
-    other_teams.sort(key=lambda x: x['elo'], reverse=True)
-    
-    print(f"\n{'='*80}")
-    print(f"{'EASTERN CONFERENCE - FINAL ELO RANKINGS':^80}")
-    print(f"{'='*80}")
-    print(f"{'Rank':<4} {'Team':<25} {'Division':<12} {'Elo':<8} {'Playoff Δ':<10}")
-    print(f"{'-'*80}")
-    
-    for i, team_data in enumerate(east_teams, 1):
-        change_str = f"+{team_data['change']:.1f}" if team_data['change'] >= 0 else f"{team_data['change']:.1f}"
-        print(f"{i:<4} {team_data['team']:<25} {team_data['division']:<12} {team_data['elo']:>7.1f} {change_str:>9}")
-    
-    print(f"\n{'='*80}")
-    print(f"{'WESTERN CONFERENCE - FINAL ELO RANKINGS':^80}")
-    print(f"{'='*80}")
-    print(f"{'Rank':<4} {'Team':<25} {'Division':<12} {'Elo':<8} {'Playoff Δ':<10}")
-    print(f"{'-'*80}")
-    
-    for i, team_data in enumerate(west_teams, 1):
-        change_str = f"+{team_data['change']:.1f}" if team_data['change'] >= 0 else f"{team_data['change']:.1f}"
-        print(f"{i:<4} {team_data['team']:<25} {team_data['division']:<12} {team_data['elo']:>7.1f} {change_str:>9}")
+        change = elo - regular_elos.get(team, 1000)
+        by_conference[team_conferences.get(team, 'Other')].append(
+            (team, team_divisions.get(team, 'Unknown'), elo, change))
+    
+    # Sort by Elo (stable, so ties keep first-appearance order)
+    for conf_teams in by_conference.values():
+        conf_teams.sort(key=lambda row: row[2], reverse=True)
+    east_teams = by_conference['Eastern']
+    west_teams = by_conference['Western']
+    other_teams = by_conference['Other']
+    
+    for title, conf_teams in (('EASTERN CONFERENCE - FINAL ELO RANKINGS', east_teams),
+                              ('WESTERN CONFERENCE - FINAL ELO RANKINGS', west_teams)):
+        print(f"\n{'='*80}")
+        print(f"{title:^80}")
+        print(f"{'='*80}")
+        print(f"{'Rank':<4} {'Team':<25} {'Division':<12} {'Elo':<8} {'Playoff Δ':<10}")
+        print(f"{'-'*80}")
+        print(_ranking_rows(conf_teams))
     
     if other_teams:
         print(f"\n{'='*80}")
         print(f"{'OTHER TEAMS':^80}")
         print(f"{'='*80}")
-        for i, team_data in enumerate(other_teams, 1):
-            change_str = f"+{team_data['change']:.1f}" if team_data['change'] >= 0 else f"{team_data['change']:.1f}"
-            print(f"{i:<4} {team_data['team']:<25} {'N/A':<12} {team_data['elo']:>7.1f} {change_str:>9}")
+        print(_ranking_rows(other_teams, show_division=False))
 
 def save_to_csv(final_elos, regular_elos):
     """Save results to CSV files"""
     team_divisions, team_conferences = create_conference_divisions()
     
-    # Prepare data
-    csv_data = []
+    # Prepare rows in column order; the rank is filled in after sorting
+    rows = []
     for team, final_elo in final_elos.items():
         regular_elo = regular_elos.get(team, 1000)
         change = final_elo - regular_elo
         
-        csv_data.append({
-            'Team': team,
-            'Conference': team_conferences.get(team, 'Unknown'),
-            'Division': team_divisions.get(team, 'Unknown'),
-            'Regular_Season_Elo': round(regular_elo, 1),
-            'Final_Elo': round(final_elo, 1),
-            'Playoff_Change': round(change, 1),
-            'Overall_Rank': 0  # Will be filled after sorting
-        })
-    
-    # Sort and add rankings
-    csv_data.sort(key=lambda x: x['Final_Elo'], reverse=True)
-    for i, row in enumerate(csv_data, 1):
-        row['Overall_Rank'] = i
+        rows.append([
+            team,
+            team_conferences.get(team, 'Unknown'),
+            team_divisions.get(team, 'Unknown'),
+            round(regular_elo, 1),
+            round(final_elo, 1),
+            round(change, 1)
+        ])
+    
+    # Sort by final Elo
+    rows.sort(key=lambda row: row[4], reverse=True)
     
     # Save to CSV
     with open('nba_2024_elo_ratings.csv', 'w', newline='') as f:
-        fieldnames = ['Overall_Rank', 'Team', 'Conference', 'Division', 
-                     'Regular_Season_Elo', 'Final_Elo', 'Playoff_Change']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(csv_data)
+        writer = csv.writer(f)
+        writer.writerow(['Overall_Rank', 'Team', 'Conference', 'Division',
+                         'Regular_Season_Elo', 'Final_Elo', 'Playoff_Change'])
+        writer.writerows([i, *row] for i, row in enumerate(rows, 1))
     
     print(f"\n✅ Elo ratings saved to 'nba_2024_elo_ratings.csv'")
 
@@ -4,79 +4,16 @@ NBA Ultimate Comprehensive Elo System Comparison
 Compares all five different Elo calculation methods
 """
 
+from rankings_data import FULL_SEASON_KDOWN, Y2025_KDOWN, Y2025_K20, FULL_K20, ADAPTIVE_K
+
 def main():
-    # All five systems we've calculated
+    # All five systems we've calculated (team order, best first)
     systems = {
-        "Original (Full, K↓)": [
-            ("Oklahoma City Thunder", 1286.2, "🏆"),
-            ("Cleveland Cavaliers", 1196.4, "🥇"),
-            ("Boston Celtics", 1184.6, "🥈"),
-            ("Minnesota Timberwolves", 1154.2, "🔥"),
-            ("Indiana Pacers", 1146.9, "📈"),
-            ("LA Clippers", 1118.9, "💪"),
-            ("Denver Nuggets", 1111.0, "⭐"),
-            ("New York Knicks", 1097.1, "🗽"),
-            ("Houston Rockets", 1095.4, "🚀"),
-            ("Golden State Warriors", 1085.8, "👑"),
-            ("Milwaukee Bucks", 1072.1, "🦌"),
-            ("Los Angeles Lakers", 1064.4, "🏀"),
-        ],
-        "2025-Only (K↓)": [
-            ("Oklahoma City Thunder", 1248.8, "🏆"),
-            ("Cleveland Cavaliers", 1156.8, "🥇"),
-            ("Minnesota Timberwolves", 1150.8, "🔥"),
-            ("Boston Celtics", 1150.8, "🥈"),
-            ("Indiana Pacers", 1146.8, "📈"),
-            ("LA Clippers", 1112.6, "💪"),
-            ("Denver Nuggets", 1104.3, "⭐"),
-            ("Golden State Warriors", 1084.7, "👑"),
-            ("Houston Rockets", 1069.4, "🚀"),
-            ("Milwaukee Bucks", 1068.0, "🦌"),
-            ("Los Angeles Lakers", 1067.0, "🏀"),
-            ("New York Knicks", 1064.9, "🗽"),
-        ],
-        "2025-Only (K=20)": [
-            ("Oklahoma City Thunder", 1213.7, "🏆"),
-            ("Indiana Pacers", 1131.8, "📈"),
-            ("Minnesota Timberwolves", 1128.6, "🔥"),
-            ("Boston Celtics", 1125.8, "🥈"),
-            ("Cleveland Cavaliers", 1124.6, "🥇"),
-            ("LA Clippers", 1096.8, "💪"),
-            ("Denver Nuggets", 1082.4, "⭐"),
-            ("Golden State Warriors", 1066.8, "👑"),
-            ("Houston Rockets", 1056.2, "🚀"),
-            ("Milwaukee Bucks", 1054.9, "🦌"),
-            ("New York Knicks", 1053.7, "🗽"),
-            ("Los Angeles Lakers", 1048.0, "🏀"),
-        ],
-        "Full Season (K=20)": [
-            ("Oklahoma City Thunder", 1255.9, "🏆"),
-            ("Cleveland Cavaliers", 1167.0, "🥇"),
-            ("Boston Celtics", 1165.5, "🥈"),
-            ("Minnesota Timberwolves", 1141.3, "🔥"),
-            ("Indiana Pacers", 1139.5, "📈"),
-            ("LA Clippers", 1113.8, "💪"),
-            ("Denver Nuggets", 1096.3, "⭐"),
-            ("New York Knicks", 1086.0, "🗽"),
-            ("Houston Rockets", 1082.9, "🚀"),
-            ("Golden State Warriors", 1077.0, "👑"),
-            ("Milwaukee Bucks", 1063.5, "🦌"),
-            ("Los Angeles Lakers", 1051.8, "🏀"),
-        ],
-        "Adaptive K (15→25)": [
-            ("Oklahoma City Thunder", 1264.3, "🏆"),
-            ("Boston Celtics", 1165.5, "🥈"),
-            ("Cleveland Cavaliers", 1164.9, "🥇"),
-            ("Indiana Pacers", 1158.4, "📈"),
-            ("Minnesota Timberwolves", 1157.4, "🔥"),
-            ("LA Clippers", 1123.1, "💪"),
-            ("Denver Nuggets", 1106.6, "⭐"),
-            ("New York Knicks", 1086.8, "🗽"),
-            ("Golden State Warriors", 1082.0, "👑"),
-            ("Houston Rockets", 1081.6, "🚀"),
-            ("Milwaukee Bucks", 1068.2, "🦌"),
-            ("Los Angeles Lakers", 1056.4, "🏀"),
-        ]
+        "Original (Full, K↓)": FULL_SEASON_KDOWN.teams[:12],
+        "2025-Only (K↓)": Y2025_KDOWN.teams[:12],
+        "2025-Only (K=20)": Y2025_K20.teams[:12],
+        "Full Season (K=20)": FULL_K20.teams,
+        "Adaptive K (15→25)": ADAPTIVE_K.teams
     }
     
     print("🏀 ULTIMATE NBA ELO SYSTEM COMPARISON")
@@ -95,51 +32,27 @@ def main():
     print(f"{'Team':<25} {'Orig':<8} {'25K↓':<8} {'25K20':<9} {'FullK20':<9} {'Adapt':<8} {'Best':<6} {'Worst':<6}")
     print("-"*110)
     
-    # Get all teams that appear in top 12 of any system
-    all_teams = set()
-    for system_name, rankings in systems.items():
-        for team, elo, emoji in rankings[:12]:
-            all_teams.add(team)
-    
-    # Create lookup dictionaries for each system
-    system_lookups = {}
-    for system_name, rankings in systems.items():
-        system_lookups[system_name] = {team: (elo, rank+1) for rank, (team, elo, emoji) in enumerate(rankings)}
+    # Rank of each team in each system (1 = top), None where a system doesn't list it
+    lookups = [{team: rank for rank, team in enumerate(teams, 1)} for teams in systems.values()]
+    all_teams = sorted({team for teams in systems.values() for team in teams})
+    ranks = {team: [lookup.get(team) for lookup in lookups] for team in all_teams}
     
-    # Sort teams by best ranking across all systems
-    team_best_ranks = {}
-    for team in all_teams:
-        ranks = []
-        for system_name in systems.keys():
-            if team in system_lookups[system_name]:
-                ranks.append(system_lookups[system_name][team][1])
-            else:
-                ranks.append(999)
-        team_best_ranks[team] = min(ranks)
+    # Best and worst over the systems that list the team
+    best_ranks = {}
+    worst_ranks = {}
+    for team, team_ranks in ranks.items():
+        listed = [rank for rank in team_ranks if rank is not None]
+        best_ranks[team] = min(listed)
+        worst_ranks[team] = max(listed)
     
-    sorted_teams = sorted(all_teams, key=lambda x: team_best_ranks[x])
+    # Sort teams by best ranking across all systems (stable, so ties stay alphabetical)
+    sorted_teams = sorted(all_teams, key=best_ranks.__getitem__)
     
+    rank_row = "{:<25} {:<8} {:<8} {:<9} {:<9} {:<8} #{:<5} #{}".format
     for team in sorted_teams[:12]:
-        # Get rankings from each system
-        orig_elo, orig_rank = system_lookups["Original (Full, K↓)"].get(team, (0, 999))
-        k2025_elo, k2025_rank = system_lookups["2025-Only (K↓)"].get(team, (0, 999))
-        f2025_elo, f2025_rank = system_lookups["2025-Only (K=20)"].get(team, (0, 999))
-        full_elo, full_rank = system_lookups["Full Season (K=20)"].get(team, (0, 999))
-        adapt_elo, adapt_rank = system_lookups["Adaptive K (15→25)"].get(team, (0, 999))
-        
-        all_ranks = [orig_rank, k2025_rank, f2025_rank, full_rank, adapt_rank]
-        valid_ranks = [r for r in all_ranks if r < 999]
-        best_rank = min(valid_ranks) if valid_ranks else 999
-        worst_rank = max(valid_ranks) if valid_ranks else 999
-        
         # Format rankings
-        orig_str = f"#{orig_rank}" if orig_rank < 999 else "---"
-        k2025_str = f"#{k2025_rank}" if k2025_rank < 999 else "---"
-        f2025_str = f"#{f2025_rank}" if f2025_rank < 999 else "---"
-        full_str = f"#{full_rank}" if full_rank < 999 else "---"
-        adapt_str = f"#{adapt_rank}" if adapt_rank < 999 else "---"
-        
-        print(f"{team:<25} {orig_str:<8} {k2025_str:<8} {f2025_str:<9} {full_str:<9} {adapt_str:<8} #{best_rank:<5} #{worst_rank}")
+        rank_strs = [f"#{rank}" if rank is not None else "---" for rank in ranks[team]]
+        print(rank_row(team, *rank_strs, best_ranks[team], worst_ranks[team]))
 
     # Key insights
     print(f"\n{'🎯 ULTIMATE INSIGHTS ACROSS ALL SYSTEMS':^110}")
@@ -4,12 +4,22 @@ NBA Finals Series Win Probability Calculator - Adaptive K System
 Uses Adaptive K (15→25) ratings for ultimate prediction accuracy
 """
 
-import math
-from itertools import product
+from series_math import (FINALS_GAMES, FINALS_HOME_MASK, expected_score, home_court_probabilities,
+                         prob_to_american_odds, series_probability_closed_form)
 
-def expected_score(rating_a, rating_b):
-    """Calculate expected score (win probability) for team A against team B"""
-    return 1 / (1 + 10**((rating_b - rating_a) / 400))
+# Thunder (#1 seed) has home court advantage
+# Remaining games (games 2-7): drop game 1's bit from the Finals home mask
+REMAINING_GAMES = FINALS_GAMES - 1
+THUNDER_HOME_GAMES = (FINALS_HOME_MASK >> 1).bit_count()
+# Pacers lead 1-0, so they need one fewer than the 4 wins that take the series
+PACERS_WINS_NEEDED = FINALS_GAMES // 2
+
+def pacers_series_probability(thunder_home_prob, pacers_home_prob):
+    """Pacers' chance to win the series from the current state (Pacers 1, Thunder 0, Game 2 next)"""
+    return series_probability_closed_form(
+        1 - thunder_home_prob, pacers_home_prob,
+        THUNDER_HOME_GAMES, REMAINING_GAMES - THUNDER_HOME_GAMES, PACERS_WINS_NEEDED
+    )
 
 def calculate_series_probability(thunder_elo, pacers_elo, home_advantage=40):
     """
@@ -18,106 +28,64 @@ def calculate_series_probability(thunder_elo, pacers_elo, home_advantage=40):
     Home court pattern: 2-2-1-1-1 (higher seed gets games 1,2,6,7)
     """
     
-    # Thunder (#1 seed) has home court advantage
-    # Game locations for remaining games (games 2-7):
-    remaining_games_locations = [
-        'thunder_home',  # Game 2
-        'pacers_home',   # Game 3  
-        'pacers_home',   # Game 4
-        'thunder_home',  # Game 5
-        'thunder_home',  # Game 6
-        'thunder_home'   # Game 7
-    ]
-    
+    lines = []
     # Calculate win probabilities for each location
-    thunder_home_prob = expected_score(thunder_elo + home_advantage, pacers_elo)
-    pacers_home_prob = expected_score(pacers_elo + home_advantage, thunder_elo)
-    
-    print(f"Individual game win probabilities:")
-    print(f"• Thunder at home: {thunder_home_prob:.1%}")
-    print(f"• Pacers at home: {pacers_home_prob:.1%}")
-    print()
-    
-    def simulate_series_from_state(pacers_wins, thunder_wins, game_index):
-        """Recursively simulate series outcomes"""
-        # Base cases: someone has won the series
-        if pacers_wins == 4:
-            return 1.0  # Pacers win probability for this path
-        elif thunder_wins == 4:
-            return 0.0  # Thunder win probability for this path
-        
-        # If we've played all 7 games, someone must have won
-        if game_index >= len(remaining_games_locations):
-            return 0.0
-        
-        # Get the win probability for the current game
-        location = remaining_games_locations[game_index]
-        if location == 'thunder_home':
-            thunder_win_prob = thunder_home_prob
-            pacers_win_prob = 1 - thunder_home_prob
-        else:  # pacers_home
-            pacers_win_prob = pacers_home_prob
-            thunder_win_prob = 1 - pacers_home_prob
-        
-        # Calculate probability weighted outcomes
-        # Pacers win this game
-        pacers_path_prob = pacers_win_prob * simulate_series_from_state(
-            pacers_wins + 1, thunder_wins, game_index + 1
-        )
-        
-        # Thunder win this game  
-        thunder_path_prob = thunder_win_prob * simulate_series_from_state(
-            pacers_wins, thunder_wins + 1, game_index + 1
-        )
-        
-        return pacers_path_prob + thunder_path_prob
-    
-    # Start simulation from current state: Pacers 1, Thunder 0, Game 2 next
-    pacers_series_probability = simulate_series_from_state(1, 0, 0)
-    thunder_series_probability = 1 - pacers_series_probability
-    
-    return pacers_series_probability, thunder_series_probability
+    thunder_home_prob, pacers_home_prob = home_court_probabilities(thunder_elo, pacers_elo, home_advantage)
+    
+    lines.append(f"Individual game win probabilities:")
+    lines.append(f"• Thunder at home: {thunder_home_prob:.1%}")
+    lines.append(f"• Pacers at home: {pacers_home_prob:.1%}")
+    lines.append("")
+    print("\n".join(lines))
+    
+    pacers_probability = pacers_series_probability(thunder_home_prob, pacers_home_prob)
+    return pacers_probability, 1 - pacers_probability
 
 def main():
+    lines = []
     # Current Elo ratings from Adaptive K (15→25) system
     thunder_elo = 1264.3  # #1 ranked team
     pacers_elo = 1158.4   # #4 ranked team
     
-    print("🏆 NBA FINALS SERIES WIN PROBABILITY - ADAPTIVE K SYSTEM")
-    print("="*75)
-    print("🎯 CURRENT SITUATION:")
-    print("• Series: Indiana Pacers vs Oklahoma City Thunder")
-    print("• Current state: PACERS LEAD 1-0")
-    print("• Format: Best of 7 (first to 4 wins)")
-    print("• Home court: Thunder (#1 seed)")
-    print()
-    
-    print("📊 TEAM RATINGS (Adaptive K: 15→25):")
-    print(f"• 🏆 Oklahoma City Thunder: {thunder_elo:.1f} Elo (#1)")
-    print(f"• 📈 Indiana Pacers: {pacers_elo:.1f} Elo (#4)")
-    print(f"• Rating difference: {thunder_elo - pacers_elo:.1f} points")
-    print("• System: K=15 for 2024 games, K=25 for 2025 games")
-    print()
-    
-    print("🏠 HOME COURT ADVANTAGE PATTERN:")
-    print("Games 1-2: Thunder home (Game 1 already played)")
-    print("Games 3-4: Pacers home") 
-    print("Game 5: Thunder home")
-    print("Games 6-7: Thunder home (if necessary)")
-    print()
+    lines.append("🏆 NBA FINALS SERIES WIN PROBABILITY - ADAPTIVE K SYSTEM")
+    lines.append("="*75)
+    lines.append("🎯 CURRENT SITUATION:")
+    lines.append("• Series: Indiana Pacers vs Oklahoma City Thunder")
+    lines.append("• Current state: PACERS LEAD 1-0")
+    lines.append("• Format: Best of 7 (first to 4 wins)")
+    lines.append("• Home court: Thunder (#1 seed)")
+    lines.append("")
+    
+    lines.append("📊 TEAM RATINGS (Adaptive K: 15→25):")
+    lines.append(f"• 🏆 Oklahoma City Thunder: {thunder_elo:.1f} Elo (#1)")
+    lines.append(f"• 📈 Indiana Pacers: {pacers_elo:.1f} Elo (#4)")
+    lines.append(f"• Rating difference: {thunder_elo - pacers_elo:.1f} points")
+    lines.append("• System: K=15 for 2024 games, K=25 for 2025 games")
+    lines.append("")
+    
+    lines.append("🏠 HOME COURT ADVANTAGE PATTERN:")
+    lines.append("Games 1-2: Thunder home (Game 1 already played)")
+    lines.append("Games 3-4: Pacers home")
+    lines.append("Game 5: Thunder home")
+    lines.append("Games 6-7: Thunder home (if necessary)")
+    lines.append("")
+    
+    # The header goes out before calculate_series_probability prints its game odds
+    print("\n".join(lines))
+    lines = []
     
     # Calculate series probabilities
     pacers_prob, thunder_prob = calculate_series_probability(thunder_elo, pacers_elo)
     
-    print("🎯 SERIES WIN PROBABILITIES:")
-    print("="*75)
-    print(f"• 📈 Indiana Pacers: {pacers_prob:.1%}")
-    print(f"• 🏆 Oklahoma City Thunder: {thunder_prob:.1%}")
-    print()
+    lines.append("🎯 SERIES WIN PROBABILITIES:")
+    lines.append("="*75)
+    lines.append(f"• 📈 Indiana Pacers: {pacers_prob:.1%}")
+    lines.append(f"• 🏆 Oklahoma City Thunder: {thunder_prob:.1%}")
+    lines.append("")
     
     # Compare across all systems
-    print("🔄 COMPARISON ACROSS ALL SYSTEMS:")
-    print("="*75)
+    lines.append("🔄 COMPARISON ACROSS ALL SYSTEMS:")
+    lines.append("="*75)
     
     # Other system probabilities (calculated separately)
     other_systems = {
@@ -128,79 +96,52 @@ def main():
     }
     
     for system_name, ratings in other_systems.items():
-        t_elo = ratings["thunder"]
-        p_elo = ratings["pacers"]
-        p_rank = ratings["pacers_rank"]
-        
-        # Quick series probability calculation
-        t_home_prob = expected_score(t_elo + 40, p_elo)
-        p_home_prob = expected_score(p_elo + 40, t_elo)
-        
-        # Simplified calculation for comparison
-        def quick_sim(p_wins, t_wins, games_left, home_pattern):
-            if p_wins == 4: return 1.0
-            if t_wins == 4: return 0.0
-            if games_left == 0: return 0.0
-            
-            if home_pattern[6-games_left] == 'thunder':
-                p_win_prob = 1 - t_home_prob
-            else:
-                p_win_prob = p_home_prob
-                
-            return (p_win_prob * quick_sim(p_wins+1, t_wins, games_left-1, home_pattern) + 
-                   (1-p_win_prob) * quick_sim(p_wins, t_wins+1, games_left-1, home_pattern))
-        
-        pattern = ['thunder', 'pacers', 'pacers', 'thunder', 'thunder', 'thunder']
-        series_prob = quick_sim(1, 0, 6, pattern)
-        
-        print(f"{system_name:<18}: Pacers #{p_rank} → {series_prob:.1%} series win chance")
-    
-    print(f"{'Adaptive K (15→25)':<18}: Pacers #4 → {pacers_prob:.1%} series win chance ⬅️ CURRENT")
-    print()
+        # Same home advantage and remaining schedule as the Adaptive K calculation
+        series_prob = pacers_series_probability(
+            *home_court_probabilities(ratings["thunder"], ratings["pacers"]))
+        lines.append(f"{system_name:<18}: Pacers #{ratings['pacers_rank']} → {series_prob:.1%} series win chance")
+    
+    lines.append(f"{'Adaptive K (15→25)':<18}: Pacers #4 → {pacers_prob:.1%} series win chance ⬅️ CURRENT")
+    lines.append("")
     
     # Statistical context
-    print("📈 ADAPTIVE K SYSTEM CONTEXT:")
-    print("="*75)
-    print("• K=15 for 2024 games (552 games): Early season, less predictive")
-    print("• K=25 for 2025 games (834 games): Recent form, more weight")
-    print("• Balances complete data with recency emphasis")
-    print("• Pacers ranked #4 (vs #2 in pure recent, #5 in most others)")
-    print("• Thunder's dominance consistent across ALL systems")
-    print()
+    lines.append("📈 ADAPTIVE K SYSTEM CONTEXT:")
+    lines.append("="*75)
+    lines.append("• K=15 for 2024 games (552 games): Early season, less predictive")
+    lines.append("• K=25 for 2025 games (834 games): Recent form, more weight")
+    lines.append("• Balances complete data with recency emphasis")
+    lines.append("• Pacers ranked #4 (vs #2 in pure recent, #5 in most others)")
+    lines.append("• Thunder's dominance consistent across ALL systems")
+    lines.append("")
     
     # Betting odds
-    def prob_to_american_odds(prob):
-        if prob >= 0.5:
-            return int(-100 * prob / (1 - prob))
-        else:
-            return int(100 * (1 - prob) / prob)
-    
     pacers_odds = prob_to_american_odds(pacers_prob)
     thunder_odds = prob_to_american_odds(thunder_prob)
     
-    print("🎲 BETTING ODDS EQUIVALENT:")
-    print("="*75)
-    print(f"• Pacers to win Finals: {pacers_odds:+d} ({pacers_prob:.1%})")
-    print(f"• Thunder to win Finals: {thunder_odds:+d} ({thunder_prob:.1%})")
-    print()
+    lines.append("🎲 BETTING ODDS EQUIVALENT:")
+    lines.append("="*75)
+    lines.append(f"• Pacers to win Finals: {pacers_odds:+d} ({pacers_prob:.1%})")
+    lines.append(f"• Thunder to win Finals: {thunder_odds:+d} ({thunder_prob:.1%})")
+    lines.append("")
     
     # Impact analysis
     neutral_game_prob = expected_score(pacers_elo, thunder_elo)
-    print("💡 IMPACT OF ADAPTIVE K SYSTEM:")
-    print("="*75)
-    print(f"• Pacers individual game chance: {neutral_game_prob:.1%} (neutral court)")
-    print(f"• Thunder's 105.9 Elo advantage creates {thunder_prob:.1%} series edge")
-    print(f"• Pacers' #4 ranking better than most systems (#5)")
-    print(f"• 1-0 lead helps but Thunder still heavily favored")
-    print()
-    
-    print("🔥 ULTIMATE INSIGHTS:")
-    print("="*75)
-    print("• Thunder STILL overwhelming favorites despite 1-0 deficit")
-    print("• Adaptive K system gives Pacers slight boost vs other systems")
-    print("• Recent form emphasis helps Pacers but not enough")
-    print("• Thunder's season-long dominance + home court too strong")
-    print("• System shows Pacers have legitimate but slim championship hopes")
+    lines.append("💡 IMPACT OF ADAPTIVE K SYSTEM:")
+    lines.append("="*75)
+    lines.append(f"• Pacers individual game chance: {neutral_game_prob:.1%} (neutral court)")
+    lines.append(f"• Thunder's 105.9 Elo advantage creates {thunder_prob:.1%} series edge")
+    lines.append(f"• Pacers' #4 ranking better than most systems (#5)")
+    lines.append(f"• 1-0 lead helps but Thunder still heavily favored")
+    lines.append("")
+    
+    lines.append("🔥 ULTIMATE INSIGHTS:")
+    lines.append("="*75)
+    lines.append("• Thunder STILL overwhelming favorites despite 1-0 deficit")
+    lines.append("• Adaptive K system gives Pacers slight boost vs other systems")
+    lines.append("• Recent form emphasis helps Pacers but not enough")
+    lines.append("• Thunder's season-long dominance + home court too strong")
+    lines.append("• System shows Pacers have legitimate but slim championship hopes")
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -7,47 +7,50 @@ Uses constant K-factor of 20 for all games
 
 import json
 import math
+import sys
 from datetime import datetime, timezone
-from collections import defaultdict
+
+from elo_constants import ELO_SCALE, INV_LOG20
 
 class EloCalculatorFixedK:
     def __init__(self, initial_elo=1000, k_factor=20):
         self.initial_elo = initial_elo
         self.k_factor = k_factor  # Fixed K-factor
-        self.team_elos = defaultdict(lambda: initial_elo)
+        # Ratings as a list indexed by team id; a team gets an id the first
+        # time it is seen
+        self.team_names = []
+        self.team_to_idx = {}
+        self.elos = []
         self.game_count = 0
     
-    def expected_score(self, rating_a, rating_b):
-        """Calculate expected score for team A against team B"""
-        return 1 / (1 + 10**((rating_b - rating_a) / 400))
-    
-    def update_elo(self, team_a, team_b, score_a, score_b):
-        """Update Elo ratings based on game result"""
-        rating_a = self.team_elos[team_a]
-        rating_b = self.team_elos[team_b]
-        
-        # Determine actual score (1 for win, 0 for loss)
-        if score_a > score_b:
-            actual_a, actual_b = 1, 0
-        else:
-            actual_a, actual_b = 0, 1
-            
-        # Calculate expected scores
-        expected_a = self.expected_score(rating_a, rating_b)
-        expected_b = self.expected_score(rating_b, rating_a)
-        
-        # Apply margin of victory multiplier
-        score_diff = abs(score_a - score_b)
-        mov_multiplier = math.log(score_diff + 1) / math.log(20)  # Logarithmic scaling
-        
-        # Update ratings using fixed K-factor
-        new_rating_a = rating_a + self.k_factor * mov_multiplier * (actual_a - expected_a)
-        new_rating_b = rating_b + self.k_factor * mov_multiplier * (actual_b - expected_b)
-        
-        self.team_elos[team_a] = new_rating_a
-        self.team_elos[team_b] = new_rating_b
-        
-        return new_rating_a, new_rating_b
+    def _team_id(self, team):
+        """Id of a team, growing the ratings list for a team not seen before"""
+        idx = self.team_to_idx.get(team)
+        if idx is None:
+            idx = len(self.team_names)
+            self.team_names.append(team)
+            self.team_to_idx[team] = idx
+            self.elos.append(float(self.initial_elo))
+        return idx
+    
+    @property
+    def team_elos(self):
+        """Current rating per team seen so far, as a dict"""
+        return dict(zip(self.team_names, self.elos))
+    
+    def process_games(self, home_idx, away_idx, home_score, away_score):
+        """Apply a run of games, given as lists of team ids from _team_id and scores, in order"""
+        elos = self.elos
+        k_factor = self.k_factor
+        for a, b, score_a, score_b in zip(home_idx, away_idx, home_score, away_score):
+            rating_a = elos[a]
+            rating_b = elos[b]
+            expected_a = 1 / (1 + math.exp((rating_b - rating_a) * ELO_SCALE))
+            mov_multiplier = math.log(abs(score_a - score_b) + 1) * INV_LOG20
+            delta = k_factor * mov_multiplier * (int(score_a > score_b) - expected_a)
+            elos[a] = rating_a + delta
+            elos[b] = rating_b - delta
+        self.game_count += len(home_idx)
 
 def load_and_process_2025_games():
     """Load and process NBA games from 2025 only"""
@@ -72,8 +75,8 @@ def load_and_process_2025_games():
                     'id': game['id'],
                     'date': game_date,
                     'stage': game['stage'],
-                    'home_team': game['teams']['home']['name'],
-                    'visitor_team': game['teams']['visitors']['name'],
+                    'home_team': sys.intern(game['teams']['home']['name']),
+                    'visitor_team': sys.intern(game['teams']['visitors']['name']),
                     'home_score': int(game['scores']['home']['points']),
                     'visitor_score': int(game['scores']['visitors']['points'])
                 })
@@ -154,14 +157,15 @@ def main():
     
     # Process all 2025 games with fixed K-factor
     print(f"\nProcessing {total_games} games with K-factor = 20...")
-    for i, game in enumerate(games_2025):
-        elo_calc.update_elo(
-            game['home_team'], 
-            game['visitor_team'],
-            game['home_score'], 
-            game['visitor_score']
-        )
-        elo_calc.game_count += 1
+    # Pack games into lists of team ids (assigned in order of first appearance) and scores
+    home_idx = []
+    away_idx = []
+    for game in games_2025:
+        home_idx.append(elo_calc._team_id(game['home_team']))
+        away_idx.append(elo_calc._team_id(game['visitor_team']))
+    home_score = [game['home_score'] for game in games_2025]
+    away_score = [game['visitor_score'] for game in games_2025]
+    elo_calc.process_games(home_idx, away_idx, home_score, away_score)
     
     # Display final results
     format_elo_display_fixed_k(elo_calc.team_elos, "FINAL ELO RATINGS - 2025 GAMES (K=20 FIXED)")
@@ -171,7 +175,7 @@ def main():
     print("2025 SEASON STATISTICS (K=20 FIXED)")
     print(f"{'='*70}")
     
-    final_elos = dict(elo_calc.team_elos)
+    final_elos = elo_calc.team_elos
     teams_that_played = {team: elo for team, elo in final_elos.items() if elo != 1000}
     
     if teams_that_played:
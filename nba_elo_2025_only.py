@@ -4,11 +4,16 @@ NBA Elo Rating Calculator for 2025 Games Only
 Calculates Elo ratings using only games played from January 1, 2025 onwards
 """
 
-import json
+import io
 import math
+import sys
 from datetime import datetime, timezone
 from collections import defaultdict
 
+import orjson
+
+from elo_constants import ELO_SCALE, INV_LOG20
+
 class EloCalculator2025:
     def __init__(self, initial_elo=1000, initial_k=40, min_k=10):
         self.initial_elo = initial_elo
@@ -25,7 +30,7 @@ class EloCalculator2025:
     
     def expected_score(self, rating_a, rating_b):
         """Calculate expected score for team A against team B"""
-        return 1 / (1 + 10**((rating_b - rating_a) / 400))
+        return 1 / (1 + math.exp((rating_b - rating_a) * ELO_SCALE))
     
     def update_elo(self, team_a, team_b, score_a, score_b, k_factor):
         """Update Elo ratings based on game result"""
@@ -33,22 +38,19 @@ class EloCalculator2025:
         rating_b = self.team_elos[team_b]
         
         # Determine actual score (1 for win, 0 for loss)
-        if score_a > score_b:
-            actual_a, actual_b = 1, 0
-        else:
-            actual_a, actual_b = 0, 1
+        actual_a = int(score_a > score_b)
             
-        # Calculate expected scores
+        # Calculate expected score
         expected_a = self.expected_score(rating_a, rating_b)
-        expected_b = self.expected_score(rating_b, rating_a)
         
         # Apply margin of victory multiplier
         score_diff = abs(score_a - score_b)
-        mov_multiplier = math.log(score_diff + 1) / math.log(20)  # Logarithmic scaling
+        mov_multiplier = math.log(score_diff + 1) * INV_LOG20  # Logarithmic scaling
         
         # Update ratings
-        new_rating_a = rating_a + k_factor * mov_multiplier * (actual_a - expected_a)
-        new_rating_b = rating_b + k_factor * mov_multiplier * (actual_b - expected_b)
+        delta = k_factor * mov_multiplier * (actual_a - expected_a)
+        new_rating_a = rating_a + delta
+        new_rating_b = rating_b - delta
         
         self.team_elos[team_a] = new_rating_a
         self.team_elos[team_b] = new_rating_b
@@ -57,8 +59,8 @@ class EloCalculator2025:
 
 def load_and_process_2025_games():
     """Load and process NBA games from 2025 only"""
-    with open('nba_2024_games.json', 'r') as f:
-        data = json.load(f)
+    with open('nba_2024_games.json', 'rb') as f:
+        data = orjson.loads(f.read())
     
     # Filter for 2025 games only (after December 31, 2024) - timezone aware
     cutoff_date = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
@@ -78,8 +80,8 @@ def load_and_process_2025_games():
                     'id': game['id'],
                     'date': game_date,
                     'stage': game['stage'],
-                    'home_team': game['teams']['home']['name'],
-                    'visitor_team': game['teams']['visitors']['name'],
+                    'home_team': sys.intern(game['teams']['home']['name']),
+                    'visitor_team': sys.intern(game['teams']['visitors']['name']),
                     'home_score': int(game['scores']['home']['points']),
                     'visitor_score': int(game['scores']['visitors']['points'])
                 })
@@ -90,17 +92,19 @@ def load_and_process_2025_games():
 
 def format_elo_display_2025(team_elos, title):
     """Format Elo ratings for nice display"""
-    print(f"\n{'='*70}")
-    print(f"{title:^70}")
-    print(f"{'='*70}")
-    print(f"{'Rank':<5} {'Team':<35} {'Elo Rating':<15}")
-    print(f"{'-'*70}")
+    out = io.StringIO()
+    out.write(f"\n{'='*70}\n")
+    out.write(f"{title:^70}\n")
+    out.write(f"{'='*70}\n")
+    out.write(f"{'Rank':<5} {'Team':<35} {'Elo Rating':<15}\n")
+    out.write(f"{'-'*70}\n")
     
     # Sort teams by Elo rating (descending)
     sorted_teams = sorted(team_elos.items(), key=lambda x: x[1], reverse=True)
     
     for rank, (team, elo) in enumerate(sorted_teams, 1):
-        print(f"{rank:<5} {team:<35} {elo:>10.1f}")
+        out.write(f"{rank:<5} {team:<35} {elo:>10.1f}\n")
+    print(out.getvalue(), end='')
 
 def create_conference_divisions_2025():
     """Create team conference and division mappings"""
@@ -179,7 +183,7 @@ def main():
     print("2025 SEASON STATISTICS")
     print(f"{'='*70}")
     
-    final_elos = dict(elo_calc.team_elos)
+    final_elos = elo_calc.team_elos
     teams_that_played = {team: elo for team, elo in final_elos.items() if elo != 1000}
     
     if teams_that_played:
@@ -4,11 +4,16 @@ NBA Elo Rating Calculator - Adaptive K-Factor by Year
 Uses K=15 for 2024 games, K=25 for 2025 games
 """
 
-import json
+import io
 import math
+import sys
 from datetime import datetime
 from collections import defaultdict
 
+import orjson
+
+from elo_constants import ELO_SCALE, INV_LOG20
+
 class EloCalculatorAdaptiveK:
     def __init__(self, initial_elo=1000, k_2024=15, k_2025=25):
         self.initial_elo = initial_elo
@@ -26,33 +31,27 @@ class EloCalculatorAdaptiveK:
     
     def expected_score(self, rating_a, rating_b):
         """Calculate expected score for team A against team B"""
-        return 1 / (1 + 10**((rating_b - rating_a) / 400))
+        return 1 / (1 + math.exp((rating_b - rating_a) * ELO_SCALE))
     
-    def update_elo(self, team_a, team_b, score_a, score_b, game_date):
-        """Update Elo ratings based on game result with adaptive K-factor"""
+    def update_elo(self, team_a, team_b, score_a, score_b, k_factor):
+        """Update Elo ratings based on game result, with the K-factor from get_k_factor"""
         rating_a = self.team_elos[team_a]
         rating_b = self.team_elos[team_b]
         
         # Determine actual score (1 for win, 0 for loss)
-        if score_a > score_b:
-            actual_a, actual_b = 1, 0
-        else:
-            actual_a, actual_b = 0, 1
+        actual_a = int(score_a > score_b)
             
-        # Calculate expected scores
+        # Calculate expected score
         expected_a = self.expected_score(rating_a, rating_b)
-        expected_b = self.expected_score(rating_b, rating_a)
         
         # Apply margin of victory multiplier
         score_diff = abs(score_a - score_b)
-        mov_multiplier = math.log(score_diff + 1) / math.log(20)  # Logarithmic scaling
-        
-        # Get K-factor based on game date
-        k_factor = self.get_k_factor(game_date)
+        mov_multiplier = math.log(score_diff + 1) * INV_LOG20  # Logarithmic scaling
         
         # Update ratings using adaptive K-factor
-        new_rating_a = rating_a + k_factor * mov_multiplier * (actual_a - expected_a)
-        new_rating_b = rating_b + k_factor * mov_multiplier * (actual_b - expected_b)
+        delta = k_factor * mov_multiplier * (actual_a - expected_a)
+        new_rating_a = rating_a + delta
+        new_rating_b = rating_b - delta
         
         self.team_elos[team_a] = new_rating_a
         self.team_elos[team_b] = new_rating_b
@@ -61,8 +60,8 @@ class EloCalculatorAdaptiveK:
 
 def load_and_process_all_games():
     """Load and process all NBA games from the 2024 season"""
-    with open('nba_2024_games.json', 'r') as f:
-        data = json.load(f)
+    with open('nba_2024_games.json', 'rb') as f:
+        data = orjson.loads(f.read())
     
     all_games = []
     for game in data['response']:
@@ -77,8 +76,8 @@ def load_and_process_all_games():
                 'id': game['id'],
                 'date': game_date,
                 'stage': game['stage'],
-                'home_team': game['teams']['home']['name'],
-                'visitor_team': game['teams']['visitors']['name'],
+                'home_team': sys.intern(game['teams']['home']['name']),
+                'visitor_team': sys.intern(game['teams']['visitors']['name']),
                 'home_score': int(game['scores']['home']['points']),
                 'visitor_score': int(game['scores']['visitors']['points'])
             })
@@ -89,17 +88,19 @@ def load_and_process_all_games():
 
 def format_elo_display_adaptive(team_elos, title):
     """Format Elo ratings for nice display"""
-    print(f"\n{'='*75}")
-    print(f"{title:^75}")
-    print(f"{'='*75}")
-    print(f"{'Rank':<5} {'Team':<35} {'Elo Rating':<15}")
-    print(f"{'-'*75}")
+    out = io.StringIO()
+    out.write(f"\n{'='*75}\n")
+    out.write(f"{title:^75}\n")
+    out.write(f"{'='*75}\n")
+    out.write(f"{'Rank':<5} {'Team':<35} {'Elo Rating':<15}\n")
+    out.write(f"{'-'*75}\n")
     
     # Sort teams by Elo rating (descending)
     sorted_teams = sorted(team_elos.items(), key=lambda x: x[1], reverse=True)
     
     for rank, (team, elo) in enumerate(sorted_teams, 1):
-        print(f"{rank:<5} {team:<35} {elo:>10.1f}")
+        out.write(f"{rank:<5} {team:<35} {elo:>10.1f}\n")
+    print(out.getvalue(), end='')
 
 def create_conference_divisions():
     """Create team conference and division mappings"""
@@ -167,21 +168,19 @@ def main():
     
     # Process all games with adaptive K-factor
     print(f"\nProcessing {total_games} games with adaptive K-factor...")
-    k_factor_usage = {'2024': 0, '2025': 0}
+    # get_k_factor gives K=15 for the 2024 games and K=25 for everything after
+    k_factor_usage = {'2024': len(games_2024), '2025': total_games - len(games_2024)}
+    k_factors = [elo_calc.get_k_factor(game['date']) for game in all_games]
     
-    for i, game in enumerate(all_games):
-        rating_a, rating_b, k_used = elo_calc.update_elo(
+    for game, k_factor in zip(all_games, k_factors):
+        elo_calc.update_elo(
             game['home_team'], 
             game['visitor_team'],
             game['home_score'], 
             game['visitor_score'],
-            game['date']
+            k_factor
         )
         elo_calc.game_count += 1
-        
-        # Track K-factor usage
-        year_key = str(game['date'].year)
-        k_factor_usage[year_key] += 1
     
     # Display final results
     format_elo_display_adaptive(elo_calc.team_elos, "FINAL ELO RATINGS - ADAPTIVE K-FACTOR BY YEAR")
@@ -191,7 +190,7 @@ def main():
     print("ADAPTIVE K-FACTOR STATISTICS")
     print(f"{'='*75}")
     
-    final_elos = dict(elo_calc.team_elos)
+    final_elos = elo_calc.team_elos
     sorted_teams = sorted(final_elos.items(), key=lambda x: x[1], reverse=True)
     
     highest_team = sorted_teams[0]
@@ -4,20 +4,54 @@ NBA Elo Rating Calculator for 2024 Season
 Calculates Elo ratings for all teams with decreasing K-factor over time
 """
 
-import json
+from array import array
+import io
 import math
-from datetime import datetime
-from collections import defaultdict
+import os
+import pickle
+from collections import namedtuple
+from functools import lru_cache
 import sys
+from types import MappingProxyType
+import orjson
+
+from elo_constants import ELO_SCALE, INV_LOG20
+
+GAMES_FILE = 'nba_2024_games.json'
+# Finished season results are pickled here, keyed on the games file's mtime and the parameters
+SEASON_CACHE_FILE = 'nba_2024_elo_season.pkl'
+SEASON_CACHE_VERSION = 6
 
 class EloCalculator:
     def __init__(self, initial_elo=1000, initial_k=40, min_k=10):
         self.initial_elo = initial_elo
         self.initial_k = initial_k
         self.min_k = min_k
-        self.team_elos = defaultdict(lambda: initial_elo)
+        # Ratings and [wins, losses] as lists indexed by team id; a team gets
+        # an id the first time it is seen
+        self.team_names = []
+        self.team_to_idx = {}
+        self.elos = []
+        self.records = []
         self.game_count = 0
-        self.elo_history = defaultdict(list)
+        self.elo_history = {}  # team -> float32 array('f') of its ratings after each game
+    
+    def _team_id(self, team):
+        """Id of a team, growing the lists for a team not seen before"""
+        idx = self.team_to_idx.get(team)
+        if idx is None:
+            idx = len(self.team_names)
+            self.team_names.append(team)
+            self.team_to_idx[team] = idx
+            self.elos.append(float(self.initial_elo))
+            self.records.append([0, 0])
+        return idx
+    
+    @property
+    def team_elos(self):
+        """Current rating per team that has played, as a dict"""
+        return {team: elo for team, elo, (wins, losses) in zip(self.team_names, self.elos, self.records)
+                if wins or losses}
         
     def calculate_k_factor(self, game_number, total_games):
         """Calculate decreasing K-factor based on game progression"""
@@ -25,150 +59,205 @@ class EloCalculator:
         k = self.initial_k * (1 - progress * 0.75) + self.min_k * progress * 0.75
         return max(k, self.min_k)
     
-    def expected_score(self, rating_a, rating_b):
-        """Calculate expected score for team A against team B"""
-        return 1 / (1 + 10**((rating_b - rating_a) / 400))
+    def calculate_k_factors(self, game_numbers, total_games):
+        """calculate_k_factor for a whole sequence of game numbers, as a list"""
+        return [self.calculate_k_factor(game_number, total_games) for game_number in game_numbers]
     
-    def update_elo(self, team_a, team_b, score_a, score_b, k_factor):
-        """Update Elo ratings based on game result"""
-        rating_a = self.team_elos[team_a]
-        rating_b = self.team_elos[team_b]
-        
-        # Determine actual score (1 for win, 0 for loss)
-        if score_a > score_b:
-            actual_a, actual_b = 1, 0
-        else:
-            actual_a, actual_b = 0, 1
-            
-        # Calculate expected scores
-        expected_a = self.expected_score(rating_a, rating_b)
-        expected_b = self.expected_score(rating_b, rating_a)
-        
-        # Apply margin of victory multiplier
-        score_diff = abs(score_a - score_b)
-        mov_multiplier = math.log(score_diff + 1) / math.log(20)  # Logarithmic scaling
-        
-        # Update ratings
-        new_rating_a = rating_a + k_factor * mov_multiplier * (actual_a - expected_a)
-        new_rating_b = rating_b + k_factor * mov_multiplier * (actual_b - expected_b)
-        
-        self.team_elos[team_a] = new_rating_a
-        self.team_elos[team_b] = new_rating_b
-        
-        return new_rating_a, new_rating_b
+    def process_games(self, home_idx, away_idx, home_score, away_score, k_factors):
+        """
+        Apply a run of games, given as lists of team ids from _team_id, scores
+        and K-factors, in order. Returns a list of the (home, away) ratings
+        after each game.
+        """
+        elos = self.elos
+        records = self.records
+        history = []
+        for a, b, score_a, score_b, k_factor in zip(home_idx, away_idx, home_score, away_score, k_factors):
+            won = int(score_a > score_b)
+            records[a][1 - won] += 1
+            records[b][won] += 1
+            rating_a = elos[a]
+            rating_b = elos[b]
+            weight = k_factor * (math.log(abs(score_a - score_b) + 1.0) * INV_LOG20)
+            delta = weight * (won - 1.0 / (1.0 + math.exp((rating_b - rating_a) * ELO_SCALE)))
+            elos[a] = rating_a + delta
+            elos[b] = rating_b - delta
+            history.append((rating_a + delta, rating_b - delta))
+        self.game_count += len(home_idx)
+        return history
 
-def load_and_process_games():
-    """Load and process NBA games from JSON file"""
-    with open('nba_2024_games.json', 'r') as f:
-        data = json.load(f)
-    
-    games = []
-    for game in data['response']:
-        # Only process finished games with valid scores
-        if (game['status']['short'] == 3 and 
-            game['scores']['home']['points'] is not None and 
-            game['scores']['visitors']['points'] is not None):
-            
-            games.append({
-                'id': game['id'],
-                'date': datetime.fromisoformat(game['date']['start'].replace('Z', '+00:00')),
-                'stage': game['stage'],
-                'home_team': game['teams']['home']['name'],
-                'visitor_team': game['teams']['visitors']['name'],
-                'home_score': int(game['scores']['home']['points']),
-                'visitor_score': int(game['scores']['visitors']['points'])
-            })
-    
-    # Sort games by date
-    games.sort(key=lambda x: x['date'])
-    return games
+# Finished games as parallel tuples, one entry per game in date order.
+# date is the ISO 8601 UTC start time string; the team columns hold interned names.
+SeasonGames = namedtuple('SeasonGames', 'ids date stage home_team visitor_team home_score visitor_score')
 
-def format_elo_display(team_elos, title):
-    """Format Elo ratings for nice display"""
-    print(f"\n{'='*60}")
-    print(f"{title:^60}")
-    print(f"{'='*60}")
-    print(f"{'Rank':<5} {'Team':<30} {'Elo Rating':<15}")
-    print(f"{'-'*60}")
+def load_and_process_games(games_file=GAMES_FILE):
+    """Load finished NBA games from the JSON file as a SeasonGames of columns"""
+    with open(games_file, 'rb') as f:
+        data = orjson.loads(f.read())
+    
+    # Only process finished games with valid scores
+    finished = [game for game in data['response']
+                if (game['status']['short'] == 3 and 
+                    game['scores']['home']['points'] is not None and 
+                    game['scores']['visitors']['points'] is not None)]
     
-    # Sort teams by Elo rating (descending)
-    sorted_teams = sorted(team_elos.items(), key=lambda x: x[1], reverse=True)
+    # One pass filling a column per field, rather than a dict per game
+    columns = ([], [], [], [], [], [], [])
+    ids, date, stage, home_team, visitor_team, home_score, visitor_score = columns
+    for game in finished:
+        ids.append(game['id'])
+        date.append(game['date']['start'])
+        stage.append(game['stage'])
+        # Interned, so each team's name is one shared string object
+        home_team.append(sys.intern(game['teams']['home']['name']))
+        visitor_team.append(sys.intern(game['teams']['visitors']['name']))
+        home_score.append(int(game['scores']['home']['points']))
+        visitor_score.append(int(game['scores']['visitors']['points']))
     
-    for rank, (team, elo) in enumerate(sorted_teams, 1):
-        print(f"{rank:<5} {team:<30} {elo:>10.1f}")
+    # Sort games by date: the timestamps share one fixed-width UTC format, so
+    # string order is time order and no datetime parsing is needed (stable sort)
+    order = sorted(range(len(date)), key=date.__getitem__)
+    return SeasonGames(*(tuple(column[i] for i in order) for column in columns))
 
-def main():
-    print("🏀 NBA Elo Calculator - 2024 Season")
-    print("Loading games and calculating Elo ratings...")
+def format_elo_display(team_names, elos, title):
+    """Format Elo ratings for nice display, from names and a ratings sequence indexed alike"""
+    out = io.StringIO()
+    out.write(f"\n{'='*60}\n")
+    out.write(f"{title:^60}\n")
+    out.write(f"{'='*60}\n")
+    out.write(f"{'Rank':<5} {'Team':<30} {'Elo Rating':<15}\n")
+    out.write(f"{'-'*60}\n")
     
-    # Load games
-    games = load_and_process_games()
-    print(f"Loaded {len(games)} finished games")
+    # Sort teams by Elo rating (descending; ties keep first-appearance order)
+    order = sorted(range(len(elos)), key=elos.__getitem__, reverse=True)
     
-    # Initialize Elo calculator
-    elo_calc = EloCalculator()
+    for rank, team_id in enumerate(order, 1):
+        out.write(f"{rank:<5} {team_names[team_id]:<30} {elos[team_id]:>10.1f}\n")
+    print(out.getvalue(), end='')
+
+# Outcome of process_season. The Elo tuples are indexed like team_names; the
+# regular-season one covers only the teams that played in it. elo_history maps
+# each team to its regular-season ratings after each game.
+SeasonResult = namedtuple('SeasonResult', 'total_games regular_season_games playoff_games team_names '
+                                          'regular_season_elos final_elos elo_history game_count')
+
+def _frozen(season):
+    """season with each history array behind a read-only view, in a read-only mapping"""
+    return season._replace(elo_history=MappingProxyType(
+        {team: memoryview(history).toreadonly() for team, history in season.elo_history.items()}))
+
+@lru_cache(maxsize=8)
+def _process_season_cached(games_file, src_mtime, initial_elo, initial_k, min_k):
+    """
+    process_season for one version of the games file and one set of parameters.
+    A completed season's result is deterministic, so it is also kept on disk
+    and reused by later runs while the key still matches.
+    """
+    cache_key = (SEASON_CACHE_VERSION, games_file, src_mtime, initial_elo, initial_k, min_k)
+    try:
+        with open(SEASON_CACHE_FILE, 'rb') as f:
+            cached_key, fields = pickle.load(f)
+        if cached_key == cache_key:
+            return _frozen(SeasonResult(*fields))
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
     
-    # Separate games by stage
-    regular_season_games = [g for g in games if g['stage'] <= 2]  # Preseason + Regular season
-    playoff_games = [g for g in games if g['stage'] == 3]  # Playoffs
+    games = load_and_process_games(games_file)
+    elo_calc = EloCalculator(initial_elo, initial_k, min_k)
     
-    total_games = len(games)
+    # Separate games by stage
+    regular_season_games = [i for i, stage in enumerate(games.stage) if stage <= 2]  # Preseason + Regular season
+    playoff_games = [i for i, stage in enumerate(games.stage) if stage == 3]  # Playoffs
+    total_games = len(games.ids)
     
-    print(f"Regular Season + Preseason: {len(regular_season_games)} games")
-    print(f"Playoffs: {len(playoff_games)} games")
+    # Pack games into lists of team ids (assigned in order of first appearance) and scores
+    season_games = regular_season_games + playoff_games
+    n_regular = len(regular_season_games)
+    home_idx = [elo_calc._team_id(games.home_team[i]) for i in season_games]
+    away_idx = [elo_calc._team_id(games.visitor_team[i]) for i in season_games]
+    home_score = [games.home_score[i] for i in season_games]
+    away_score = [games.visitor_score[i] for i in season_games]
+    regular, playoffs = slice(0, n_regular), slice(n_regular, None)
     
     # Process regular season games
-    print("\nProcessing regular season games...")
-    for i, game in enumerate(regular_season_games):
-        k_factor = elo_calc.calculate_k_factor(i, len(regular_season_games))
-        
-        elo_calc.update_elo(
-            game['home_team'], 
-            game['visitor_team'],
-            game['home_score'], 
-            game['visitor_score'],
-            k_factor
-        )
-        elo_calc.game_count += 1
-        
-        # Store Elo history
-        elo_calc.elo_history[game['home_team']].append(elo_calc.team_elos[game['home_team']])
-        elo_calc.elo_history[game['visitor_team']].append(elo_calc.team_elos[game['visitor_team']])
+    k_factors = elo_calc.calculate_k_factors(range(n_regular), n_regular)
+    history = elo_calc.process_games(home_idx[regular], away_idx[regular],
+                                     home_score[regular], away_score[regular], k_factors)
     
-    # Save regular season Elo ratings
-    regular_season_elos = dict(elo_calc.team_elos)
+    # Store Elo history: each team's rating after each of its games, picked out
+    # of the per-game history into one float32 array per team (the running
+    # ratings stay float64 so rounding doesn't accumulate)
+    regular_home, regular_away = home_idx[regular], away_idx[regular]
+    team_histories = [array('f') for _ in elo_calc.team_names]
+    for a, b, (rating_a, rating_b) in zip(regular_home, regular_away, history):
+        team_histories[a].append(rating_a)
+        team_histories[b].append(rating_b)
+    for team, team_history in zip(elo_calc.team_names, team_histories):
+        if team_history:
+            elo_calc.elo_history[team] = team_history
     
-    # Display regular season results
-    format_elo_display(regular_season_elos, "ELO RATINGS - END OF REGULAR SEASON")
+    # Save regular season Elo ratings. Ids follow first appearance and the regular
+    # season comes first, so its teams are the leading block of ids.
+    n_regular_teams = len(set(regular_home).union(regular_away))
+    regular_season_elos = tuple(elo_calc.elos[:n_regular_teams])
     
     # Process playoff games
     if playoff_games:
-        print(f"\nProcessing {len(playoff_games)} playoff games...")
-        for i, game in enumerate(playoff_games):
-            # Use lower K-factor for playoffs (more stable ratings)
-            k_factor = elo_calc.calculate_k_factor(
-                len(regular_season_games) + i, 
-                total_games
-            )
-            
-            elo_calc.update_elo(
-                game['home_team'], 
-                game['visitor_team'],
-                game['home_score'], 
-                game['visitor_score'],
-                k_factor
-            )
-            elo_calc.game_count += 1
+        # The playoffs continue the K-factor schedule over all games
+        k_factors = elo_calc.calculate_k_factors(range(n_regular, total_games), total_games)
+        elo_calc.process_games(home_idx[playoffs], away_idx[playoffs],
+                               home_score[playoffs], away_score[playoffs], k_factors)
+    
+    season = SeasonResult(total_games, n_regular, len(playoff_games), tuple(elo_calc.team_names),
+                          regular_season_elos, tuple(elo_calc.elos), elo_calc.elo_history, elo_calc.game_count)
+    
+    try:
+        with open(SEASON_CACHE_FILE, 'wb') as f:
+            # Pickled as a plain tuple: the class may live in __main__ or in the imported module
+            pickle.dump((cache_key, tuple(season)), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Read-only checkout: just recompute next time
+    return _frozen(season)
+
+def process_season(games_file=GAMES_FILE, initial_elo=1000, initial_k=40, min_k=10):
+    """
+    Run the Elo calculation over a season file and return a SeasonResult.
+    Cached per file version and parameters; the result is shared, so its
+    ratings are tuples and elo_history is a read-only mapping of read-only views.
+    """
+    return _process_season_cached(games_file, os.path.getmtime(games_file),
+                                  initial_elo, initial_k, min_k)
+
+def main():
+    print("🏀 NBA Elo Calculator - 2024 Season")
+    print("Loading games and calculating Elo ratings...")
+    
+    season = process_season()
+    print(f"Loaded {season.total_games} finished games")
+    
+    print(f"Regular Season + Preseason: {season.regular_season_games} games")
+    print(f"Playoffs: {season.playoff_games} games")
+    
+    print("\nRegular season results:")
+    team_names = season.team_names
+    regular_season_elos = season.regular_season_elos
+    
+    # Display regular season results
+    format_elo_display(team_names, regular_season_elos, "ELO RATINGS - END OF REGULAR SEASON")
+    
+    if season.playoff_games:
+        print(f"\nPlayoff results ({season.playoff_games} games):")
         
         # Display final playoff results
-        format_elo_display(elo_calc.team_elos, "ELO RATINGS - END OF PLAYOFFS")
+        format_elo_display(team_names, season.final_elos, "ELO RATINGS - END OF PLAYOFFS")
     
     # Show some interesting statistics
     print(f"\n{'='*60}")
     print("SEASON STATISTICS")
     print(f"{'='*60}")
     
-    final_elos = dict(elo_calc.team_elos)
+    # Final ratings by team, in order of first appearance
+    final_elos = dict(zip(team_names, season.final_elos))
     highest_team = max(final_elos.items(), key=lambda x: x[1])
     lowest_team = min(final_elos.items(), key=lambda x: x[1])
     
@@ -178,17 +267,14 @@ def main():
     print(f"Average Elo: {sum(final_elos.values()) / len(final_elos):.1f}")
     
     # Show biggest Elo changes
-    if regular_season_elos:
+    if len(regular_season_elos):
         print(f"\n{'='*60}")
         print("BIGGEST ELO CHANGES FROM REGULAR SEASON TO PLAYOFFS")
         print(f"{'='*60}")
         
-        changes = []
-        for team in final_elos:
-            if team in regular_season_elos:
-                change = final_elos[team] - regular_season_elos[team]
-                changes.append((team, change))
-        
+        # The regular-season ratings are the leading block of team ids
+        changes = [(team, final_elos[team] - regular_elo)
+                   for team, regular_elo in zip(team_names, regular_season_elos)]
         changes.sort(key=lambda x: x[1], reverse=True)
         
         print("Biggest Gainers:")
@@ -4,11 +4,15 @@ NBA Elo Rating Calculator - Full Season with Fixed K-Factor
 Calculates Elo ratings for the entire 2024 season using fixed K=20
 """
 
-import json
+import io
 import math
-from datetime import datetime
+import sys
 from collections import defaultdict
 
+import orjson
+
+from elo_constants import ELO_SCALE, INV_LOG20
+
 class EloCalculatorFullSeasonFixedK:
     def __init__(self, initial_elo=1000, k_factor=20):
         self.initial_elo = initial_elo
@@ -18,7 +22,7 @@ class EloCalculatorFullSeasonFixedK:
     
     def expected_score(self, rating_a, rating_b):
         """Calculate expected score for team A against team B"""
-        return 1 / (1 + 10**((rating_b - rating_a) / 400))
+        return 1 / (1 + math.exp((rating_b - rating_a) * ELO_SCALE))
     
     def update_elo(self, team_a, team_b, score_a, score_b):
         """Update Elo ratings based on game result"""
@@ -26,22 +30,19 @@ class EloCalculatorFullSeasonFixedK:
         rating_b = self.team_elos[team_b]
         
         # Determine actual score (1 for win, 0 for loss)
-        if score_a > score_b:
-            actual_a, actual_b = 1, 0
-        else:
-            actual_a, actual_b = 0, 1
+        actual_a = int(score_a > score_b)
             
-        # Calculate expected scores
+        # Calculate expected score
         expected_a = self.expected_score(rating_a, rating_b)
-        expected_b = self.expected_score(rating_b, rating_a)
         
         # Apply margin of victory multiplier
         score_diff = abs(score_a - score_b)
-        mov_multiplier = math.log(score_diff + 1) / math.log(20)  # Logarithmic scaling
+        mov_multiplier = math.log(score_diff + 1) * INV_LOG20  # Logarithmic scaling
         
         # Update ratings using fixed K-factor
-        new_rating_a = rating_a + self.k_factor * mov_multiplier * (actual_a - expected_a)
-        new_rating_b = rating_b + self.k_factor * mov_multiplier * (actual_b - expected_b)
+        delta = self.k_factor * mov_multiplier * (actual_a - expected_a)
+        new_rating_a = rating_a + delta
+        new_rating_b = rating_b - delta
         
         self.team_elos[team_a] = new_rating_a
         self.team_elos[team_b] = new_rating_b
@@ -50,8 +51,8 @@ class EloCalculatorFullSeasonFixedK:
 
 def load_and_process_all_games():
     """Load and process all NBA games from the 2024 season"""
-    with open('nba_2024_games.json', 'r') as f:
-        data = json.load(f)
+    with open('nba_2024_games.json', 'rb') as f:
+        data = orjson.loads(f.read())
     
     all_games = []
     for game in data['response']:
@@ -60,35 +61,35 @@ def load_and_process_all_games():
             game['scores']['home']['points'] is not None and 
             game['scores']['visitors']['points'] is not None):
             
-            game_date = datetime.fromisoformat(game['date']['start'].replace('Z', '+00:00'))
-            
             all_games.append({
                 'id': game['id'],
-                'date': game_date,
+                'date': game['date']['start'],  # ISO 8601 UTC string
                 'stage': game['stage'],
-                'home_team': game['teams']['home']['name'],
-                'visitor_team': game['teams']['visitors']['name'],
+                'home_team': sys.intern(game['teams']['home']['name']),
+                'visitor_team': sys.intern(game['teams']['visitors']['name']),
                 'home_score': int(game['scores']['home']['points']),
                 'visitor_score': int(game['scores']['visitors']['points'])
             })
     
-    # Sort games by date
+    # Sort games by the ISO date strings (see nba_elo_calculator.load_and_process_games)
     all_games.sort(key=lambda x: x['date'])
     return all_games
 
 def format_elo_display_full_season(team_elos, title):
     """Format Elo ratings for nice display"""
-    print(f"\n{'='*70}")
-    print(f"{title:^70}")
-    print(f"{'='*70}")
-    print(f"{'Rank':<5} {'Team':<35} {'Elo Rating':<15}")
-    print(f"{'-'*70}")
+    out = io.StringIO()
+    out.write(f"\n{'='*70}\n")
+    out.write(f"{title:^70}\n")
+    out.write(f"{'='*70}\n")
+    out.write(f"{'Rank':<5} {'Team':<35} {'Elo Rating':<15}\n")
+    out.write(f"{'-'*70}\n")
     
     # Sort teams by Elo rating (descending)
     sorted_teams = sorted(team_elos.items(), key=lambda x: x[1], reverse=True)
     
     for rank, (team, elo) in enumerate(sorted_teams, 1):
-        print(f"{rank:<5} {team:<35} {elo:>10.1f}")
+        out.write(f"{rank:<5} {team:<35} {elo:>10.1f}\n")
+    print(out.getvalue(), end='')
 
 def create_conference_divisions():
     """Create team conference and division mappings"""
@@ -132,7 +133,7 @@ def main():
     # Show date range
     first_game = all_games[0]
     last_game = all_games[-1]
-    print(f"Date Range: {first_game['date'].strftime('%Y-%m-%d')} to {last_game['date'].strftime('%Y-%m-%d')}")
+    print(f"Date Range: {first_game['date'][:10]} to {last_game['date'][:10]}")
     
     # Initialize Elo calculator with fixed K-factor
     elo_calc = EloCalculatorFullSeasonFixedK(k_factor=20)
@@ -167,7 +168,7 @@ def main():
     print("FULL SEASON STATISTICS (K=20 FIXED)")
     print(f"{'='*70}")
     
-    final_elos = dict(elo_calc.team_elos)
+    final_elos = elo_calc.team_elos
     sorted_teams = sorted(final_elos.items(), key=lambda x: x[1], reverse=True)
     
     highest_team = sorted_teams[0]
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+NBA Elo Rankings Data - Final ratings of each Elo system, shared by the display scripts
+"""
+
+from collections import namedtuple
+
+# One system's final ratings as parallel tuples, best team first
+Rankings = namedtuple('Rankings', ['teams', 'elos'])
+
+def _rankings(rows):
+    """Pack (team, elo) rows into a Rankings of a name tuple and an Elo tuple"""
+    return Rankings(tuple(team for team, _ in rows), tuple(elo for _, elo in rows))
+
+# Full season, K=40→10 decreasing (matches nba_2024_elo_ratings.csv)
+FULL_SEASON_KDOWN = _rankings((
+    ("Oklahoma City Thunder", 1286.2),
+    ("Cleveland Cavaliers", 1196.4),
+    ("Boston Celtics", 1184.6),
+    ("Minnesota Timberwolves", 1154.2),
+    ("Indiana Pacers", 1146.9),
+    ("LA Clippers", 1118.9),
+    ("Denver Nuggets", 1111.0),
+    ("New York Knicks", 1097.1),
+    ("Houston Rockets", 1095.4),
+    ("Golden State Warriors", 1085.8),
+    ("Milwaukee Bucks", 1072.1),
+    ("Los Angeles Lakers", 1064.4),
+    ("Detroit Pistons", 1049.3),
+    ("Memphis Grizzlies", 1047.7),
+    ("Portland Trail Blazers", 990.2),
+    ("Chicago Bulls", 988.1),
+    ("Orlando Magic", 986.9),
+    ("Sacramento Kings", 985.8),
+    ("Miami Heat", 975.3),
+    ("Atlanta Hawks", 956.3),
+    ("Dallas Mavericks", 951.4),
+    ("Phoenix Suns", 937.4),
+    ("San Antonio Spurs", 925.7),
+    ("Toronto Raptors", 904.2),
+    ("Brooklyn Nets", 823.1),
+    ("New Orleans Pelicans", 815.6),
+    ("Philadelphia 76ers", 810.2),
+    ("Utah Jazz", 788.9),
+    ("Charlotte Hornets", 753.1),
+    ("Washington Wizards", 741.4),
+))
+
+# 2025 games only, K=40→10 decreasing
+Y2025_KDOWN = _rankings((
+    ("Oklahoma City Thunder", 1248.8),
+    ("Cleveland Cavaliers", 1156.8),
+    ("Minnesota Timberwolves", 1150.8),
+    ("Boston Celtics", 1150.8),
+    ("Indiana Pacers", 1146.8),
+    ("LA Clippers", 1112.6),
+    ("Denver Nuggets", 1104.3),
+    ("Golden State Warriors", 1084.7),
+    ("Houston Rockets", 1069.4),
+    ("Milwaukee Bucks", 1068.0),
+    ("Los Angeles Lakers", 1067.0),
+    ("New York Knicks", 1064.9),
+    ("Detroit Pistons", 1061.6),
+    ("Portland Trail Blazers", 1020.7),
+    ("Chicago Bulls", 1009.1),
+    ("Memphis Grizzlies", 1006.2),
+    ("Sacramento Kings", 988.5),
+    ("Orlando Magic", 979.5),
+    ("Miami Heat", 958.4),
+    ("Atlanta Hawks", 946.2),
+    ("Phoenix Suns", 941.7),
+    ("Toronto Raptors", 936.2),
+    ("San Antonio Spurs", 919.7),
+    ("Dallas Mavericks", 913.3),
+    ("New Orleans Pelicans", 868.9),
+    ("Brooklyn Nets", 841.4),
+    ("Utah Jazz", 811.2),
+    ("Philadelphia 76ers", 796.1),
+    ("Charlotte Hornets", 790.8),
+    ("Washington Wizards", 785.4),
+))
+
+# 2025 games only, K=20 fixed (top 15)
+Y2025_K20 = _rankings((
+    ("Oklahoma City Thunder", 1213.7),
+    ("Indiana Pacers", 1131.8),
+    ("Minnesota Timberwolves", 1128.6),
+    ("Boston Celtics", 1125.8),
+    ("Cleveland Cavaliers", 1124.6),
+    ("LA Clippers", 1096.8),
+    ("Denver Nuggets", 1082.4),
+    ("Golden State Warriors", 1066.8),
+    ("Houston Rockets", 1056.2),
+    ("Milwaukee Bucks", 1054.9),
+    ("New York Knicks", 1053.7),
+    ("Los Angeles Lakers", 1048.0),
+    ("Detroit Pistons", 1044.4),
+    ("Portland Trail Blazers", 1012.6),
+    ("Chicago Bulls", 1012.2),
+))
+
+# Full season, K=20 fixed (top 12)
+FULL_K20 = _rankings((
+    ("Oklahoma City Thunder", 1255.9),
+    ("Cleveland Cavaliers", 1167.0),
+    ("Boston Celtics", 1165.5),
+    ("Minnesota Timberwolves", 1141.3),
+    ("Indiana Pacers", 1139.5),
+    ("LA Clippers", 1113.8),
+    ("Denver Nuggets", 1096.3),
+    ("New York Knicks", 1086.0),
+    ("Houston Rockets", 1082.9),
+    ("Golden State Warriors", 1077.0),
+    ("Milwaukee Bucks", 1063.5),
+    ("Los Angeles Lakers", 1051.8),
+))
+
+# Full season, K=15 for 2024 games and K=25 for 2025 games (top 12)
+ADAPTIVE_K = _rankings((
+    ("Oklahoma City Thunder", 1264.3),
+    ("Boston Celtics", 1165.5),
+    ("Cleveland Cavaliers", 1164.9),
+    ("Indiana Pacers", 1158.4),
+    ("Minnesota Timberwolves", 1157.4),
+    ("LA Clippers", 1123.1),
+    ("Denver Nuggets", 1106.6),
+    ("New York Knicks", 1086.8),
+    ("Golden State Warriors", 1082.0),
+    ("Houston Rockets", 1081.6),
+    ("Milwaukee Bucks", 1068.2),
+    ("Los Angeles Lakers", 1056.4),
+))
+
+WESTERN_CONFERENCE = frozenset({
+    "Dallas Mavericks", "Denver Nuggets", "Golden State Warriors", "Houston Rockets",
+    "LA Clippers", "Los Angeles Lakers", "Memphis Grizzlies", "Minnesota Timberwolves",
+    "New Orleans Pelicans", "Oklahoma City Thunder", "Phoenix Suns", "Portland Trail Blazers",
+    "Sacramento Kings", "San Antonio Spurs", "Utah Jazz",
+})
+
+def western_mask(rankings):
+    """Tuple of bools, True where the team at that rank plays in the West"""
+    return tuple(team in WESTERN_CONFERENCE for team in rankings.teams)
+
+TEAM_EMOJI = {
+    "Oklahoma City Thunder": "🏆",
+    "Cleveland Cavaliers": "🥇",
+    "Boston Celtics": "🥈",
+    "Minnesota Timberwolves": "🔥",
+    "Indiana Pacers": "📈",
+    "LA Clippers": "💪",
+    "Denver Nuggets": "⭐",
+    "New York Knicks": "🗽",
+    "Houston Rockets": "🚀",
+    "Golden State Warriors": "👑",
+    "Milwaukee Bucks": "🦌",
+    "Los Angeles Lakers": "🏀",
+    "Detroit Pistons": "🔧",
+    "Memphis Grizzlies": "🐻",
+    "Portland Trail Blazers": "🌲",
+    "Chicago Bulls": "🐂",
+    "Orlando Magic": "✨",
+    "Sacramento Kings": "👑",
+    "Miami Heat": "🔥",
+    "Atlanta Hawks": "🦅",
+    "Dallas Mavericks": "🐴",
+    "Phoenix Suns": "☀️",
+    "San Antonio Spurs": "⚡",
+    "Toronto Raptors": "🦖",
+    "Brooklyn Nets": "🕸️",
+    "New Orleans Pelicans": "🦢",
+    "Philadelphia 76ers": "🔔",
+    "Utah Jazz": "🎵",
+    "Charlotte Hornets": "🐝",
+    "Washington Wizards": "🧙",
+}
+
+def with_emoji(rankings, start=0, stop=None):
+    """(team, elo, emoji) display rows for a slice of a Rankings"""
+    teams = rankings.teams[start:stop]
+    return list(zip(teams, rankings.elos[start:stop], (TEAM_EMOJI[team] for team in teams)))
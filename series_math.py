@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+NBA Series Math - Elo game and series win probabilities shared by the Finals scripts
+"""
+
+import math
+from functools import lru_cache
+
+from elo_constants import ELO_SCALE
+
+# Finals home court as these scripts schedule it: bit i set = Thunder (#1 seed)
+# at home for game i + 1, i.e. games 1, 2, 5, 6, 7
+FINALS_GAMES = 7
+FINALS_HOME_MASK = 0b1110011
+
+def expected_score(rating_a, rating_b):
+    """Calculate expected score (win probability) for team A against team B"""
+    return 1 / (1 + math.exp((rating_b - rating_a) * ELO_SCALE))
+
+@lru_cache(maxsize=128)
+def home_court_probabilities(team_elo, opponent_elo, home_advantage=40):
+    """
+    (team wins at home, opponent wins at home) single-game probabilities for
+    one matchup. Cached, since a script asks for the same pair once per
+    series scenario.
+    """
+    return (expected_score(team_elo + home_advantage, opponent_elo),
+            expected_score(opponent_elo + home_advantage, team_elo))
+
+def series_probability_closed_form(p_away, p_home, away_games, home_games, wins_needed):
+    """
+    A team's chance to win a series when it needs wins_needed of the remaining
+    away_games (each won with p_away) and home_games (each won with p_home).
+    Playing every remaining game out never changes who reaches 4 first, so this
+    is the chance of winning at least wins_needed of them: a fixed polynomial
+    (two binomials convolved) instead of a walk over game paths.
+    """
+    # Chance of winning exactly j of the home games, then at least k of them
+    # (home_tail[home_games + 1] == 0), tabulated once before the away loop
+    home_pmf = [math.comb(home_games, j) * p_home**j * (1 - p_home)**(home_games - j)
+                for j in range(home_games + 1)]
+    home_tail = [sum(home_pmf[k:]) for k in range(home_games + 2)]
+    
+    total = 0.0
+    for i in range(away_games + 1):
+        away_term = math.comb(away_games, i) * p_away**i * (1 - p_away)**(away_games - i)
+        total += away_term * home_tail[min(max(wins_needed - i, 0), home_games + 1)]
+    return total
+
+def prob_to_american_odds(prob):
+    """
+    American moneyline odds for a win probability, truncated toward zero by
+    int(): favourites negative, underdogs positive.
+    Raises ValueError for a probability outside (0, 1), which has no odds.
+    """
+    if not 0 < prob < 1:
+        raise ValueError(f"Probability must be strictly between 0 and 1, got {prob}")
+    # 100 * favourite / underdog, negative from 0.5 up (p - 0.5 == +0.0 there too)
+    return int(-math.copysign(100 * max(prob, 1 - prob) / min(prob, 1 - prob), prob - 0.5))
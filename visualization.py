@@ -9,30 +9,50 @@ Author: NBA Analytics Team
 Version: 1.0.0
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from typing import List, Dict, Optional
-import pandas as pd
+from typing import List, Dict, Optional, TYPE_CHECKING
 from betting_market_vs_models import FinalsAnalyzer, ModelType, ProbabilityEstimate
 
-# Set professional styling
-plt.style.use('default')
-sns.set_palette("husl")
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+_plt = None
+
+def _get_plt():
+    """Import pyplot (and apply the chart styling) on first use."""
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as pyplot
+        import seaborn as sns
+        
+        # Set professional styling
+        pyplot.style.use('default')
+        sns.set_palette("husl")
+        _plt = pyplot
+    return _plt
 
 class MarketVisualizer:
     """Professional visualization class for betting market analysis."""
     
-    def __init__(self, analyzer):
-        """Initialize with a FinalsAnalyzer instance."""
+    def __init__(self, analyzer, dpi: int = 300):
+        """
+        Initialize with a FinalsAnalyzer instance.
+        
+        Args:
+            analyzer: FinalsAnalyzer with the estimates to plot
+            dpi: Resolution for saved charts (export quality by default; lower
+                it for faster, smaller files)
+        """
         self.analyzer = analyzer
         self.figure_size = (12, 8)
+        self.dpi = dpi
         
     def create_probability_chart(self, save_path: Optional[str] = None):
         """Create probability comparison bar chart."""
         if not self.analyzer.estimates:
             raise ValueError("No estimates available")
             
+        plt = _get_plt()
         models = [est.model_type.value for est in self.analyzer.estimates]
         team_a_probs = [est.team_a_probability for est in self.analyzer.estimates]
         team_b_probs = [est.team_b_probability for est in self.analyzer.estimates]
@@ -71,12 +91,13 @@ class MarketVisualizer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
             
         return fig
     
-    def create_odds_comparison_chart(self, save_path: str = None) -> plt.Figure:
+    def create_odds_comparison_chart(self, save_path: str = None) -> 'plt.Figure':
         """Create a chart showing implied odds from different models."""
+        plt = _get_plt()
         from betting_market_vs_models import BettingOddsConverter
         
         if not self.analyzer.estimates:
@@ -84,8 +105,8 @@ class MarketVisualizer:
             
         # Prepare data
         models = [est.model_type.value for est in self.analyzer.estimates]
-        odds = [BettingOddsConverter.probability_to_american(est.team_a_probability) 
-                for est in self.analyzer.estimates]
+        odds = BettingOddsConverter.probabilities_to_american(
+            [est.team_a_probability for est in self.analyzer.estimates])
         
         # Create figure
         fig, ax = plt.subplots(figsize=self.figure_size)
@@ -114,12 +135,13 @@ class MarketVisualizer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
             
         return fig
     
-    def create_market_edge_analysis(self, save_path: str = None) -> plt.Figure:
+    def create_market_edge_analysis(self, save_path: str = None) -> 'plt.Figure':
         """Create visualization showing potential market edges."""
+        plt = _get_plt()
         if len(self.analyzer.estimates) < 2:
             raise ValueError("Need at least 2 estimates for edge analysis")
             
@@ -186,12 +208,13 @@ class MarketVisualizer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
             
         return fig
     
-    def create_comprehensive_dashboard(self, save_path: str = None) -> plt.Figure:
+    def create_comprehensive_dashboard(self, save_path: str = None) -> 'plt.Figure':
         """Create a comprehensive dashboard combining all visualizations."""
+        plt = _get_plt()
         fig = plt.figure(figsize=(20, 12))
         
         # Create grid layout
@@ -222,7 +245,7 @@ class MarketVisualizer:
                      fontsize=16, fontweight='bold')
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
             
         return fig
 